@@ -351,6 +351,15 @@ echo [*] Installing accelerate (for CPU offload support)...
 !VENV_PYTHON! -m pip install accelerate --quiet
 echo [OK] Accelerate installed
 
+REM Install hf_transfer for faster model downloads (optional)
+echo [*] Installing hf_transfer (faster model downloads)...
+!VENV_PYTHON! -m pip install hf_transfer --quiet
+if !ERRORLEVEL! neq 0 (
+    echo [WARNING] hf_transfer not installed, downloads will use the standard downloader
+) else (
+    echo [OK] hf_transfer installed
+)
+
 REM Verify installation
 echo [*] Verifying installation...
 !VENV_PYTHON! -c "import moshi; import torch; print(f'PyTorch: {torch.__version__}'); print(f'CUDA available: {torch.cuda.is_available()}')"
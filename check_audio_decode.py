@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+End-to-end check of the web client's audio path.
+
+Encodes a test tone with the server's Opus writer, wraps each frame the way the
+server sends it (0x01 tag + Ogg pages), and feeds it through the client's own
+message handling and decodeAudio code (taken from the page served by
+moshi/moshi/server.py) into the bundled decoder worker, run under Node.js.
+The decoded audio must be the same tone.
+
+Requires: sphn, numpy and Node.js (node on PATH).
+
+Created by SurAiverse - https://www.youtube.com/@suraiverse
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SCRIPT_DIR = Path(__file__).parent
+SERVER_FILE = SCRIPT_DIR / "moshi" / "moshi" / "server.py"
+WORKER_FILE = SCRIPT_DIR / "client" / "public" / "assets" / "decoderWorker.min.js"
+WASM_FILE = SCRIPT_DIR / "client" / "public" / "assets" / "decoderWorker.min.wasm"
+
+SAMPLE_RATE = 24000
+FRAME_SIZE = 1920  # one Mimi frame (80 ms)
+NUM_FRAMES = 25
+TONE_HZ = 440.0
+
+# Runs the decoder worker in a sandbox that looks like a Web Worker, and the client
+# code against it. Transfers go through structuredClone, so views keep their offsets
+# exactly as postMessage would deliver them.
+NODE_HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [workerFile, wasmFile, clientFile, messagesFile] = process.argv.slice(2);
+const client = JSON.parse(fs.readFileSync(clientFile, 'utf8'));
+const messages = JSON.parse(fs.readFileSync(messagesFile, 'utf8'));
+
+const output = [];
+const worker = {
+    Module: { wasmBinary: fs.readFileSync(wasmFile) },
+    importScripts() {},
+    location: { href: '' },
+    postMessage(data) { if (data) output.push(Array.from(data[0])); },
+    console, WebAssembly, setTimeout, clearTimeout, performance, TextDecoder,
+};
+worker.self = worker;
+vm.createContext(worker);
+vm.runInContext(fs.readFileSync(workerFile, 'utf8'), worker);
+
+const pending = [];
+const decoderWorker = {
+    postMessage(msg, transfer) {
+        pending.push(worker.onmessage({ data: structuredClone(msg, { transfer: transfer || [] }) }));
+    },
+};
+const BOS_PAGE = new Uint8Array(client.bosPage);
+const decodeAudio = new Function('decoderWorker', client.decodeAudio + '\nreturn decodeAudio;')(decoderWorker);
+const onAudioMessage = new Function('decodeAudio', 'buf', client.audioBranch);
+
+decoderWorker.postMessage({ command: 'init', bufferLength: 960, decoderSampleRate: 24000,
+                            outputBufferSampleRate: 24000, resampleQuality: 0 });
+decoderWorker.postMessage({ command: 'decode', pages: BOS_PAGE });
+for (const bytes of messages) {
+    onAudioMessage(decodeAudio, new Uint8Array(bytes).buffer);
+}
+worker.Module.mainReady.then(() => setTimeout(() => {
+    process.stdout.write(JSON.stringify(output.flat()));
+}, 0));
+"""
+
+
+def extract_block(source: str, start: str) -> str:
+    """Return the brace-delimited JS block starting at ``start`` in ``source``."""
+    begin = source.index(start)
+    depth = 0
+    for i in range(source.index("{", begin), len(source)):
+        if source[i] == "{":
+            depth += 1
+        elif source[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return source[begin:i + 1]
+    raise ValueError(f"unterminated block: {start}")
+
+
+def extract_client_code() -> dict:
+    """Pull the audio path of the client out of the page embedded in server.py."""
+    # Python unescapes the page string when serving it; do the same for the JS we run
+    source = SERVER_FILE.read_text(encoding="utf-8").replace("\\\\", "\\")
+    decode_audio = extract_block(source, "function decodeAudio(")
+    call = re.search(r"if \(msgType === 0x01\) \{\s*(decodeAudio\(.*?\);)", source)
+    if call is None:
+        raise ValueError("audio branch of socket.onmessage not found")
+    bos = extract_block(source, "const BOS_PAGE = new Uint8Array(")
+    bos = re.sub(r"//[^\n]*", "", bos)
+    bos_page = [int(b, 16) for b in re.findall(r"0x([0-9A-Fa-f]{2})", bos)]
+    return {"decodeAudio": decode_audio, "audioBranch": call.group(1), "bosPage": bos_page}
+
+
+def encode_server_frames(tone) -> list:
+    """Encode ``tone`` frame by frame like ServerState does, as tagged messages."""
+    import sphn
+    writer = sphn.OpusStreamWriter(SAMPLE_RATE)
+    messages = []
+    for start in range(0, len(tone), FRAME_SIZE):
+        writer.append_pcm(tone[start:start + FRAME_SIZE])
+        pages = writer.read_bytes()
+        if len(pages) > 0:
+            messages.append(list(b"\x01" + pages))
+    return messages
+
+
+def main():
+    print("=" * 70)
+    print("PersonaPlex Client Audio Decode Check")
+    print("=" * 70)
+
+    node = shutil.which("node")
+    if node is None:
+        print("[SKIP] Node.js not found - install it to run this check")
+        return 0
+    try:
+        import sphn  # noqa: F401
+    except ImportError:
+        missing = True
+    else:
+        missing = np is None
+    if missing:
+        print("[SKIP] sphn and numpy are required (install the moshi requirements)")
+        return 0
+
+    t = np.arange(FRAME_SIZE * NUM_FRAMES) / SAMPLE_RATE
+    tone = (0.5 * np.sin(2 * np.pi * TONE_HZ * t)).astype(np.float32)
+    messages = encode_server_frames(tone)
+    print(f"[OK] Encoded {len(messages)} server audio messages")
+
+    work_dir = SCRIPT_DIR / ".audio_check"
+    work_dir.mkdir(exist_ok=True)
+    try:
+        (work_dir / "harness.js").write_text(NODE_HARNESS, encoding="utf-8")
+        (work_dir / "client.json").write_text(json.dumps(extract_client_code()), encoding="utf-8")
+        (work_dir / "messages.json").write_text(json.dumps(messages), encoding="utf-8")
+        result = subprocess.run(
+            [node, str(work_dir / "harness.js"), str(WORKER_FILE), str(WASM_FILE),
+             str(work_dir / "client.json"), str(work_dir / "messages.json")],
+            capture_output=True, text=True, timeout=60,
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if result.returncode != 0:
+        print(f"[ERROR] Decoder harness failed:\n{result.stderr}")
+        return 1
+
+    decoded = np.array(json.loads(result.stdout), dtype=np.float32)
+    # Skip the codec's start-up transient, then look for the tone
+    steady = decoded[FRAME_SIZE * 2:]
+    if len(steady) < FRAME_SIZE:
+        print(f"[ERROR] Decoder produced only {len(decoded)} samples")
+        return 1
+    spectrum = np.abs(np.fft.rfft(steady * np.hanning(len(steady))))
+    freqs = np.fft.rfftfreq(len(steady), 1 / SAMPLE_RATE)
+    peak_hz = freqs[np.argmax(spectrum)]
+    rms = float(np.sqrt(np.mean(steady ** 2)))
+    print(f"   Decoded {len(decoded)} samples, peak {peak_hz:.0f} Hz, RMS {rms:.3f}")
+
+    if abs(peak_hz - TONE_HZ) < 10 and rms > 0.1:
+        print("[OK] Server audio frames decode to the original tone")
+        return 0
+    print("[ERROR] Decoded audio does not match the encoded tone (garbled playback)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
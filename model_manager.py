@@ -9,10 +9,15 @@ import os
 import sys
 import json
 import shutil
+import stat
+import tempfile
 import hashlib
+import mmap
+import struct
 from pathlib import Path
 from typing import Optional, Callable, Tuple, Dict, List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 # HuggingFace Hub imports
@@ -20,6 +25,7 @@ try:
     from huggingface_hub import (
         hf_hub_download, 
         hf_hub_url, 
+        get_hf_file_metadata,
         try_to_load_from_cache,
         HfApi,
         snapshot_download
@@ -33,6 +39,22 @@ try:
 except ImportError:
     HF_AVAILABLE = False
 
+# Prefer orjson for config (de)serialization when it is installed
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # Constants
 HF_REPO = "nvidia/personaplex-7b-v1"
@@ -102,8 +124,7 @@ class ModelConfig:
         
         if os.path.exists(config_path):
             try:
-                with open(config_path, "r") as f:
-                    data = json.load(f)
+                data = _loads(Path(config_path).read_bytes())
                 return cls(**data)
             except Exception:
                 pass
@@ -124,8 +145,32 @@ class ModelConfig:
             "hf_cache_dir": self.hf_cache_dir,
         }
         
-        with open(config_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a half-written config
+        config_dir = os.path.dirname(os.path.abspath(config_path))
+        fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix=".model_config.", suffix=".tmp")
+        try:
+            # mkstemp creates the file 0600; keep the permissions a plain open() would give
+            os.chmod(tmp_path, _config_file_mode(config_path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, config_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def _config_file_mode(config_path: str) -> int:
+    """Permission bits for a rewritten config: those of the existing file, or 0666 minus
+    the umask (what open(path, "w") creates) for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(config_path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 class ModelManager:
@@ -145,6 +190,9 @@ class ModelManager:
         self.log_callback = log_callback or (lambda msg, level: print(f"[{level.upper()}] {msg}"))
         self.config = ModelConfig.load()
         self._cancel_flag = False
+        # HfApi client and the token it was built with (see _api)
+        self._api_client: Optional["HfApi"] = None
+        self._api_token: Optional[str] = None
     
     def log(self, message: str, level: str = "info"):
         """Log a message"""
@@ -183,6 +231,19 @@ class ModelManager:
         
         return None
     
+    @property
+    def _api(self) -> "HfApi":
+        """Shared HfApi client so repeated calls reuse its HTTP session.
+
+        Rebuilt whenever the token changes (e.g. the user sets HF_TOKEN or logs in
+        after the first check), so calls never run with a stale token.
+        """
+        token = self.get_hf_token()
+        if self._api_client is None or token != self._api_token:
+            self._api_client = HfApi(token=token)
+            self._api_token = token
+        return self._api_client
+    
     def check_authentication(self) -> Tuple[bool, str]:
         """
         Check if HuggingFace authentication is set up.
@@ -198,8 +259,7 @@ class ModelManager:
             return False, "No HuggingFace token found. Set HF_TOKEN environment variable or run 'huggingface-cli login'"
         
         try:
-            api = HfApi(token=token)
-            user_info = api.whoami()
+            user_info = self._api.whoami()
             return True, f"Authenticated as: {user_info.get('name', 'Unknown')}"
         except Exception as e:
             return False, f"Authentication failed: {str(e)}"
@@ -214,12 +274,9 @@ class ModelManager:
         if not HF_AVAILABLE:
             return False, "huggingface_hub not installed"
         
-        token = self.get_hf_token()
-        
         try:
             # Try to get file info - will fail if license not accepted
-            api = HfApi(token=token)
-            api.hf_hub_url(repo_id=HF_REPO, filename="config.json")
+            self._api.hf_hub_url(repo_id=HF_REPO, filename="config.json")
             return True, "License accepted"
         except GatedRepoError:
             return False, f"License not accepted. Please visit: https://huggingface.co/{HF_REPO}"
@@ -255,6 +312,96 @@ class ModelManager:
         
         return None
     
+    @staticmethod
+    def _read_safetensors_header_size(filepath: str) -> int:
+        """
+        Read the 8-byte little-endian header length of a safetensors file.
+        
+        Where madvise is available (not Windows), the file is mapped the same
+        way the safetensors loader maps it and the kernel is asked to read
+        ahead, so validation also warms the page cache for the later load.
+        
+        Args:
+            filepath: Path to the safetensors file
+            
+        Returns:
+            Header size in bytes
+        """
+        with open(filepath, "rb") as f:
+            if not hasattr(mmap, "MADV_SEQUENTIAL"):
+                return struct.unpack("<Q", f.read(8))[0]
+            
+            mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                mm.madvise(mmap.MADV_WILLNEED)
+                return struct.unpack_from("<Q", mm, 0)[0]
+            finally:
+                mm.close()
+    
+    def _find_local_blob(self, etag: str, expected_size: int) -> Optional[Path]:
+        """
+        Find a blob with the given etag in any other repo of the HuggingFace cache.
+        
+        Blobs in the cache are named by their etag (the sha256 for LFS files),
+        so a name and size match means the content is identical.
+        
+        Args:
+            etag: Etag of the file on the Hub
+            expected_size: Size of the file on the Hub in bytes
+            
+        Returns:
+            Path to the matching blob or None
+        """
+        for repo_dir in self.get_hf_cache_dir().glob("models--*"):
+            candidate = repo_dir / "blobs" / etag
+            try:
+                if candidate.stat().st_size == expected_size:
+                    return candidate
+            except OSError:
+                continue
+        return None
+    
+    def _reuse_local_blob(self, filename: str, token: Optional[str]) -> bool:
+        """
+        Hardlink an identical blob from another cached repo into this repo's cache.
+        
+        hf_hub_download then finds the blob in place and skips the transfer.
+        
+        Args:
+            filename: Name of the file in HF_REPO
+            token: HuggingFace token
+            
+        Returns:
+            True if a blob was linked into place
+        """
+        try:
+            metadata = get_hf_file_metadata(hf_hub_url(repo_id=HF_REPO, filename=filename), token=token)
+        except Exception:
+            return False
+        
+        if not metadata.etag or metadata.size is None:
+            return False
+        
+        blobs_dir = self.get_hf_cache_dir() / ("models--" + HF_REPO.replace("/", "--")) / "blobs"
+        target = blobs_dir / metadata.etag
+        if target.exists():
+            return False
+        
+        source = self._find_local_blob(metadata.etag, metadata.size)
+        if source is None:
+            return False
+        
+        try:
+            blobs_dir.mkdir(parents=True, exist_ok=True)
+            os.link(source, target)
+        except OSError:
+            # Cross-device or unsupported filesystem - fall back to a normal download
+            return False
+        
+        self.log(f"Reusing cached copy of {filename} from {source.parent.parent.name}", "info")
+        return True
+    
     def validate_file(self, filepath: str, file_info: Dict) -> Tuple[bool, str]:
         """
         Validate a model file.
@@ -283,10 +430,9 @@ class ModelManager:
         if filepath.endswith(".safetensors"):
             try:
                 # Just check if the file header is valid
-                with open(filepath, "rb") as f:
-                    header_size = int.from_bytes(f.read(8), "little")
-                    if header_size > 10_000_000:  # Header shouldn't be larger than 10MB
-                        return False, "Invalid safetensors header"
+                header_size = self._read_safetensors_header_size(filepath)
+                if header_size > 10_000_000:  # Header shouldn't be larger than 10MB
+                    return False, "Invalid safetensors header"
             except Exception as e:
                 return False, f"Could not validate safetensors file: {str(e)}"
         
@@ -367,6 +513,9 @@ class ModelManager:
                 if valid:
                     return True, cached
         
+        if not force:
+            self._reuse_local_blob(filename, token)
+        
         self.log(f"Downloading {filename}...", "info")
         
         try:
@@ -416,17 +565,20 @@ class ModelManager:
         if include_optional:
             files_to_download.update(OPTIONAL_FILES)
         
-        total = len(files_to_download)
+        # Weight progress by expected size so small files don't dominate the bar
+        total_bytes = sum(info["min_size_bytes"] for info in files_to_download.values())
+        downloaded_bytes = 0
         
-        for i, (filename, info) in enumerate(files_to_download.items()):
+        for filename, info in files_to_download.items():
             if self._cancel_flag:
                 errors.append("Download cancelled by user")
                 break
             
-            progress = i / total
+            progress = downloaded_bytes / total_bytes
             self.progress(f"Downloading {filename}...", progress)
             
             success, result = self.download_file(filename, force=force)
+            downloaded_bytes += info["min_size_bytes"]
             
             if not success:
                 if filename in REQUIRED_FILES:
@@ -515,17 +667,53 @@ class ModelManager:
             List of removed file paths
         """
         removed = []
+        invalid_files = [
+            model_file for model_file in self.check_model_status()
+            if model_file.exists and not model_file.valid and model_file.path
+        ]
+        
+        if not invalid_files:
+            return removed
+        
+        # Deletes are I/O-bound and can block on network mounts, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(4, len(invalid_files))) as executor:
+            results = list(executor.map(lambda mf: (mf, self._try_unlink(mf.path)), invalid_files))
+        
+        for model_file, error in results:
+            if error is None:
+                removed.append(model_file.path)
+                self.log(f"Removed invalid file: {model_file.filename}", "warning")
+            else:
+                self.log(f"Could not remove {model_file.filename}: {error}", "error")
         
-        for model_file in self.check_model_status():
-            if model_file.exists and not model_file.valid and model_file.path:
+        return removed
+    
+    @staticmethod
+    def _try_unlink(filepath: str) -> Optional[str]:
+        """
+        Delete a file, dropping its pages from the page cache first where supported.
+        
+        Args:
+            filepath: Path to the file
+            
+        Returns:
+            None on success, otherwise the error message
+        """
+        if hasattr(os, "posix_fadvise"):
+            try:
+                fd = os.open(filepath, os.O_RDONLY)
                 try:
-                    os.remove(model_file.path)
-                    removed.append(model_file.path)
-                    self.log(f"Removed invalid file: {model_file.filename}", "warning")
-                except Exception as e:
-                    self.log(f"Could not remove {model_file.filename}: {e}", "error")
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
         
-        return removed
+        try:
+            os.unlink(filepath)
+        except Exception as e:
+            return str(e)
+        return None
 
 
 def print_model_status():
@@ -970,17 +970,25 @@ class LMGen(StreamingModule[_LMGenState]):
         if raw_audio.ndim == 1:
             raw_audio = raw_audio[None, :]
 
-        self.voice_prompt_audio = raw_audio
+        self.set_voice_prompt_audio(voice_prompt, raw_audio)
+
+    def set_voice_prompt_audio(self, voice_prompt: str, audio: torch.Tensor):
+        """Use already loaded and normalized voice prompt audio of shape (1, T)."""
+        self.voice_prompt = voice_prompt
+        self.voice_prompt_audio = audio
         self.voice_prompt_cache: Optional[torch.Tensor] = None
         self.voice_prompt_embeddings: Optional[torch.Tensor] = None
 
     def load_voice_prompt_embeddings(self, path: str):
-        self.voice_prompt = path
         state = torch.load(path)
+        self.set_voice_prompt_embeddings(path, state["embeddings"], state["cache"])
 
+    def set_voice_prompt_embeddings(self, voice_prompt: str, embeddings: torch.Tensor, cache: torch.Tensor):
+        """Use already loaded voice prompt embeddings and KV cache, skipping Mimi entirely."""
+        self.voice_prompt = voice_prompt
         self.voice_prompt_audio = None
-        self.voice_prompt_embeddings = state["embeddings"].to(self.lm_model.device)
-        self.voice_prompt_cache = state["cache"].to(self.lm_model.device)
+        self.voice_prompt_embeddings = embeddings.to(self.lm_model.device)
+        self.voice_prompt_cache = cache.to(self.lm_model.device)
 
     def _encode_zero_frame(self) -> torch.Tensor:
         return torch.as_tensor(
@@ -126,9 +126,7 @@ def _is_safetensors(path: Path | str) -> bool:
     return Path(path).suffix in (".safetensors", ".sft", ".sfts")
 
 
-def get_mimi(filename: str | Path,
-             device: torch.device | str = 'cpu') -> MimiModel:
-    """Return a pretrained Mimi model."""
+def _build_mimi(device: torch.device | str) -> MimiModel:
     encoder = SEANetEncoder(**_seanet_kwargs)
     decoder = SEANetDecoder(**_seanet_kwargs)
     encoder_transformer = transformer.ProjectedTransformer(
@@ -154,6 +152,13 @@ def get_mimi(filename: str | Path,
         decoder_transformer=decoder_transformer,
     ).to(device=device)
     model.eval()
+    return model
+
+
+def get_mimi(filename: str | Path,
+             device: torch.device | str = 'cpu') -> MimiModel:
+    """Return a pretrained Mimi model."""
+    model = _build_mimi(device)
     if _is_safetensors(filename):
         load_model(model, filename)
     else:
@@ -163,6 +168,18 @@ def get_mimi(filename: str | Path,
     return model
 
 
+def get_mimi_sharing_weights(mimi: MimiModel) -> MimiModel:
+    """Return a second Mimi model whose parameters and buffers alias those of `mimi`.
+
+    Only the streaming state is per instance, so this is a cheap replacement for
+    loading the same checkpoint twice.
+    """
+    model = _build_mimi(torch.device("meta"))
+    model.load_state_dict(mimi.state_dict(), assign=True)
+    model.set_num_codebooks(mimi.num_codebooks)
+    return model
+
+
 def get_moshi_lm(
     filename: str | Path | None,
     copy_missing_weights: bool = True,
@@ -276,6 +293,53 @@ def get_moshi_lm(
     return model
 
 
+class _Int8DynamicLinear(torch.nn.Module):
+    """Dynamic int8 stand-in for a CPU `nn.Linear`, keeping the caller's dtype."""
+
+    def __init__(self, linear: torch.nn.Linear):
+        super().__init__()
+        float_linear = torch.nn.Linear(
+            linear.in_features, linear.out_features, bias=linear.bias is not None,
+            device="cpu", dtype=torch.float32,
+        )
+        float_linear.weight = torch.nn.Parameter(linear.weight.detach().float(), requires_grad=False)
+        if linear.bias is not None:
+            float_linear.bias = torch.nn.Parameter(linear.bias.detach().float(), requires_grad=False)
+        float_linear.qconfig = torch.ao.quantization.default_dynamic_qconfig
+        self.qlinear = torch.ao.nn.quantized.dynamic.Linear.from_float(float_linear)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.qlinear(x.float()).to(x.dtype)
+
+
+def _is_int8_dynamic_candidate(name: str) -> bool:
+    # Only layers invoked as modules can be swapped. Gating FFNs, the attention input
+    # projections and the depformer per-step projections read `.weight` directly.
+    return (
+        name == "text_linear"
+        or name.startswith("linears.")
+        or name.startswith("depformer_in.")
+        or (name.startswith("transformer.") and name.endswith("self_attn.out_proj"))
+    )
+
+
+def quantize_lm_int8_dynamic(model: LMModel) -> int:
+    """Replace the eligible linear layers of a CPU Moshi LM with dynamic int8 ones.
+
+    Returns:
+        Number of replaced layers.
+    """
+    targets = [
+        name for name, module in model.named_modules()
+        if isinstance(module, torch.nn.Linear) and _is_int8_dynamic_candidate(name)
+    ]
+    for name in targets:
+        parent_name, _, child_name = name.rpartition(".")
+        parent = model.get_submodule(parent_name) if parent_name else model
+        setattr(parent, child_name, _Int8DynamicLinear(getattr(parent, child_name)))
+    return len(targets)
+
+
 def _get_moshi_lm_with_offload(
     filename: str | Path,
     copy_missing_weights: bool,
@@ -256,6 +256,8 @@ class RingKVCache:
             dtype=dtype,
         )
         self.end_offset = torch.zeros(1, device=device, dtype=torch.long)
+        # Slot indexes never change, build them once rather than on every step.
+        self._slot_indexes = torch.arange(capacity, device=device, dtype=torch.long)
 
     def reset(self):
         self.end_offset.zero_()
@@ -272,9 +274,7 @@ class RingKVCache:
         keys = self.cache[0]
         values = self.cache[1]
 
-        indexes = torch.arange(
-            self.capacity, device=self.end_offset.device, dtype=torch.long
-        )
+        indexes = self._slot_indexes
         invalid = indexes >= self.end_offset
 
         end_index = self.end_offset % self.capacity
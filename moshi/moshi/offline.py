@@ -80,14 +80,20 @@ def seed_all(seed: int):
     torch.backends.cudnn.benchmark = False
 
 
+_SYSTEM_TAG = "<system>"
+_SYSTEM_TAG_LEN = len(_SYSTEM_TAG)
+_SYSTEM_TEMPLATE = _SYSTEM_TAG + " {} " + _SYSTEM_TAG
+
+
 def wrap_with_system_tags(text: str) -> str:
     """Add system tags as the model expects if they are missing.
     Example: "<system> You enjoy having a good conversation. Have a deep conversation about technology. Your name is Jane. <system>"
     """
     cleaned = text.strip()
-    if cleaned.startswith("<system>") and cleaned.endswith("<system>"):
+    # Length check first: a string shorter than two tags can't already be wrapped
+    if len(cleaned) >= _SYSTEM_TAG_LEN * 2 and cleaned.startswith(_SYSTEM_TAG) and cleaned.endswith(_SYSTEM_TAG):
         return cleaned
-    return f"<system> {cleaned} <system>"
+    return _SYSTEM_TEMPLATE.format(cleaned)
 
 
 def warmup(mimi: MimiModel, other_mimi: MimiModel, lm_gen: LMGen, device: str, frame_size: int):
@@ -187,7 +193,7 @@ def run_inference(
     if mimi_weight is None:
         mimi_weight = hf_hub_download(hf_repo, loaders.MIMI_NAME)  # type: ignore
     mimi = loaders.get_mimi(mimi_weight, device)
-    other_mimi = loaders.get_mimi(mimi_weight, device)
+    other_mimi = loaders.get_mimi_sharing_weights(mimi)
     log("info", "mimi loaded")
 
     # 2) Load tokenizer
@@ -26,7 +26,12 @@
 
 import argparse
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from email.utils import formatdate
+import gzip
+import hashlib
 import random
 import os
 from pathlib import Path
@@ -38,6 +43,7 @@ from typing import Literal, Optional
 
 import aiohttp
 from aiohttp import web
+from aiohttp.web_log import AccessLogger
 from huggingface_hub import hf_hub_download
 import numpy as np
 import sentencepiece
@@ -45,6 +51,11 @@ import sphn
 import torch
 import random
 
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
 from .client_utils import make_log, colorize
 from .models import loaders, MimiModel, LMModel, LMGen
 from .utils.connection import create_ssl_context, get_lan_ip
@@ -73,7 +84,21 @@ def seed_all(seed):
     random.seed(seed)
     np.random.seed(seed)
     torch.backends.cudnn.deterministic = False
-    torch.backends.cudnn.benchmark = True  # Enable cuDNN auto-tuning for better performance
+
+
+# Web client sources at the repository root (built dist, public decoder assets)
+_CLIENT_DIR = Path(__file__).parent.parent.parent / "client"
+
+# Read/write size for files streamed from disk without sendfile (always the case over
+# TLS, e.g. --ssl). aiohttp's default is 256 KiB.
+_STATIC_CHUNK_SIZE = 1024 * 1024
+
+# Max number of voice prompts kept loaded across connections (LRU)
+_VOICE_CACHE_SIZE = 32
+
+_SYSTEM_TAG = "<system>"
+_SYSTEM_TAG_LEN = len(_SYSTEM_TAG)
+_SYSTEM_TEMPLATE = _SYSTEM_TAG + " {} " + _SYSTEM_TAG
 
 
 def wrap_with_system_tags(text: str) -> str:
@@ -81,9 +106,10 @@ def wrap_with_system_tags(text: str) -> str:
     Example: "<system> You enjoy having a good conversation. Have a deep conversation about technology. Your name is Jane. <system>"
     """
     cleaned = text.strip()
-    if cleaned.startswith("<system>") and cleaned.endswith("<system>"):
+    # Length check first: a string shorter than two tags can't already be wrapped
+    if len(cleaned) >= _SYSTEM_TAG_LEN * 2 and cleaned.startswith(_SYSTEM_TAG) and cleaned.endswith(_SYSTEM_TAG):
         return cleaned
-    return f"<system> {cleaned} <system>"
+    return _SYSTEM_TEMPLATE.format(cleaned)
 
 
 @dataclass
@@ -96,13 +122,23 @@ class ServerState:
 
     def __init__(self, mimi: MimiModel, other_mimi: MimiModel, text_tokenizer: sentencepiece.SentencePieceProcessor,
                  lm: LMModel, device: str | torch.device, voice_prompt_dir: str | None = None,
-                 save_voice_prompt_embeddings: bool = False):
+                 save_voice_prompt_embeddings: bool = False, compile_mimi: bool = False):
         self.mimi = mimi
         self.other_mimi = other_mimi
         self.text_tokenizer = text_tokenizer
         self.device = device
         self.voice_prompt_dir = voice_prompt_dir
         self.frame_size = int(self.mimi.sample_rate / self.mimi.frame_rate)
+        # Let the SEANet encoder/decoder go through torch.compile (see MimiModel docstring
+        # for the torch version caveats). Compilation happens during warmup().
+        self.compile_mimi = compile_mimi
+        self.mimi.torch_compile_encoder_decoder = compile_mimi
+        self.other_mimi.torch_compile_encoder_decoder = compile_mimi
+        # Ready-to-send text messages for every token id, so emitting a token is one lookup
+        self._piece_msgs = [
+            b"\x02" + text_tokenizer.id_to_piece(i).replace("▁", " ").encode("utf-8")  # type: ignore
+            for i in range(text_tokenizer.get_piece_size())
+        ]
         self.lm_gen = LMGen(lm,
                             audio_silence_frame_cnt=int(0.5 * self.mimi.frame_rate),
                             sample_rate=self.mimi.sample_rate,
@@ -111,30 +147,152 @@ class ServerState:
                             save_voice_prompt_embeddings=save_voice_prompt_embeddings,
         )
         
+        # Pinned host buffers for the per-frame outputs, so the PCM and text token come back
+        # in one async D2H transfer instead of two blocking syncs (.cpu() then .item()).
+        if self.device.type == 'cuda':
+            self._pcm_host = torch.empty(self.frame_size, dtype=torch.float32, pin_memory=True)
+            self._text_host = torch.empty((), dtype=torch.long, pin_memory=True)
+            # blocking: the waiting thread sleeps instead of spinning (see _wait_frame_events)
+            self._d2h_event = torch.cuda.Event(blocking=True)
+            # Same idea for the input chunk: pinned staging + static device buffer for H2D
+            self._chunk_host = torch.empty((1, 1, self.frame_size), dtype=torch.float32, pin_memory=True)
+            self._chunk_dev = torch.empty((1, 1, self.frame_size), dtype=torch.float32, device=self.device)
+            self._h2d_event = torch.cuda.Event()
+            # Mimi decode runs on its own stream so it can overlap the next frame's LM step
+            self._mimi_stream = torch.cuda.Stream()
+            self._text_event = torch.cuda.Event(blocking=True)
+        
+        # Voice prompt path -> ("embeddings", embeddings, cache) or ("audio", audio)
+        self._voice_cache: OrderedDict[str, tuple] = OrderedDict()
+
         self.lock = asyncio.Lock()
         self.mimi.streaming_forever(1)
         self.other_mimi.streaming_forever(1)
         self.lm_gen.streaming_forever(1)
     
+    def _cache_voice_entry(self, voice_prompt_path: str, entry: tuple):
+        self._voice_cache[voice_prompt_path] = entry
+        if len(self._voice_cache) > _VOICE_CACHE_SIZE:
+            self._voice_cache.popitem(last=False)
+
+    def _cache_voice_embeddings(self, voice_prompt_path: str) -> tuple:
+        # Pre-saved voice prompt embeddings, loaded straight onto the device
+        state = torch.load(voice_prompt_path, map_location=self.device, weights_only=True)
+        entry = ("embeddings", state["embeddings"], state["cache"])
+        self._cache_voice_entry(voice_prompt_path, entry)
+        return entry
+
+    def preload_voice_prompts(self):
+        """Load the .pt voice prompts of voice_prompt_dir ahead of the first connection,
+        so connection setup does no disk I/O or unpickling for them."""
+        if self.voice_prompt_dir is None:
+            return
+        names = sorted(f for f in os.listdir(self.voice_prompt_dir) if f.endswith('.pt'))
+        for name in names[:_VOICE_CACHE_SIZE]:
+            self._cache_voice_embeddings(os.path.join(self.voice_prompt_dir, name))
+        logger.info(f"preloaded {min(len(names), _VOICE_CACHE_SIZE)}/{len(names)} voice prompts")
+
+    def _select_voice_prompt(self, voice_prompt_path: str):
+        """Point lm_gen at a voice prompt, reusing what earlier connections already loaded."""
+        entry = self._voice_cache.get(voice_prompt_path)
+        if entry is None:
+            if voice_prompt_path.endswith('.pt'):
+                entry = self._cache_voice_embeddings(voice_prompt_path)
+            else:
+                self.lm_gen.load_voice_prompt(voice_prompt_path)
+                entry = ("audio", self.lm_gen.voice_prompt_audio)
+                self._cache_voice_entry(voice_prompt_path, entry)
+        else:
+            self._voice_cache.move_to_end(voice_prompt_path)
+
+        if entry[0] == "embeddings":
+            self.lm_gen.set_voice_prompt_embeddings(voice_prompt_path, entry[1], entry[2])
+        else:
+            self.lm_gen.set_voice_prompt_audio(voice_prompt_path, entry[1])
+
     def warmup(self):
-        # More warmup iterations for CUDA graphs to stabilize
-        for _ in range(8):
-            chunk = torch.zeros(1, 1, self.frame_size, dtype=torch.float32, device=self.device)
-            codes = self.mimi.encode(chunk)
-            for c in range(codes.shape[-1]):
-                tokens = self.lm_gen.step(codes[:, :, c: c + 1])
-                if tokens is None:
-                    continue
-                _ = self.mimi.decode(tokens[:, 1:9])
+        # More warmup iterations for CUDA graphs to stabilize. The transformer stacks of
+        # LMGen and Mimi are CUDAGraphed and get captured here; reset_streaming() keeps the
+        # captured graphs, so live connections only replay them.
+        # With compile_mimi, extra iterations let Inductor finish compiling before serving.
+        # cuDNN auto-tuning only during warmup: the frame shape is fixed, so the plans picked
+        # here are the ones used at runtime, and no re-search can happen mid-session.
+        torch.backends.cudnn.benchmark = True
+        # TF32 for the fp32 Mimi convs and matmuls on Ampere+ (the LM itself runs in bf16).
+        # Set before capture so the CUDA graphs record the TF32 kernels.
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        chunk = torch.zeros(1, 1, self.frame_size, dtype=torch.float32, device=self.device)
+        for _ in range(16 if self.compile_mimi else 8):
+            # Same calls as opus_loop, so the side-stream decode path is exercised too
+            tokens = self._step_lm(chunk)
+            if tokens is not None:
+                _ = self._decode(tokens)
 
         if self.device.type == 'cuda':
             torch.cuda.synchronize()
             # Clear CUDA cache after warmup to free any fragmented memory
             torch.cuda.empty_cache()
+        torch.backends.cudnn.benchmark = False
+
+    def _upload_chunk(self, chunk: np.ndarray) -> torch.Tensor:
+        """Move one input PCM frame to the device as a [1, 1, frame_size] tensor.
+        On CUDA the copy goes through the pinned staging buffer and is non-blocking."""
+        if self.device.type != 'cuda':
+            # copy=True: the caller reuses its buffer, so never alias it on CPU
+            return torch.from_numpy(chunk).to(device=self.device, copy=True)[None, None]
+        # The previous upload must have left the staging buffer before overwriting it
+        self._h2d_event.synchronize()
+        self._chunk_host[0, 0].numpy()[:] = chunk
+        self._chunk_dev.copy_(self._chunk_host, non_blocking=True)
+        self._h2d_event.record()
+        return self._chunk_dev
+
+    def _step_lm(self, chunk: torch.Tensor) -> Optional[torch.Tensor]:
+        """Encode one [1, 1, frame_size] input frame with Mimi and run one LM step on it.
+        Returns the generated tokens, or None while the LM is still filling its delays."""
+        # One frame of audio always encodes to exactly one step (LMGen.step asserts it)
+        tokens = self.lm_gen.step(self.mimi.encode(chunk))
+        if tokens is not None:
+            assert tokens.shape[1] == self.lm_gen.lm_model.dep_q + 1
+        return tokens
+
+    def _decode(self, tokens: torch.Tensor) -> torch.Tensor:
+        """Decode the agent audio codebooks of `tokens` with Mimi.
+        On CUDA this is queued on the Mimi side stream once the LM step has produced `tokens`."""
+        if self.device.type != 'cuda':
+            return self.mimi.decode(tokens[:, 1:9])
+        self._mimi_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(self._mimi_stream):
+            # tokens was allocated on the main stream, keep it alive for the side stream
+            tokens.record_stream(self._mimi_stream)
+            return self.mimi.decode(tokens[:, 1:9])
+
+    def _wait_frame_events(self):
+        """Block until both device-to-host copies of the frame have completed."""
+        self._d2h_event.synchronize()
+        self._text_event.synchronize()
 
+    async def _fetch_frame_outputs(self, main_pcm: torch.Tensor, tokens: torch.Tensor) -> tuple[np.ndarray, int]:
+        """Copy the decoded PCM frame and the text token to the host.
+        On CUDA both copies are issued non-blocking, each on the stream that produced it,
+        and waited for on a worker thread so the event loop keeps running (without spinning)
+        until they land. The returned array is only valid until the next call."""
+        if self.device.type != 'cuda':
+            return main_pcm[0, 0].numpy(), tokens[0, 0, 0].item()
+        self._text_host.copy_(tokens[0, 0, 0], non_blocking=True)
+        self._text_event.record()
+        with torch.cuda.stream(self._mimi_stream):
+            self._pcm_host.copy_(main_pcm[0, 0], non_blocking=True)
+            self._d2h_event.record()
+        if not (self._d2h_event.query() and self._text_event.query()):
+            # Not the opus executor: incoming audio keeps decoding while we wait
+            await asyncio.get_running_loop().run_in_executor(None, self._wait_frame_events)
+        return self._pcm_host.numpy(), int(self._text_host)
 
     async def handle_chat(self, request):
-        ws = web.WebSocketResponse()
+        # No permessage-deflate: Opus frames don't compress and deflate adds per-message latency
+        ws = web.WebSocketResponse(compress=False)
         await ws.prepare(request)
         clog = ColorizedLog.randomize()
         peer = request.remote  # IP
@@ -155,7 +313,10 @@ class ServerState:
             if voice_prompt_filename is not None:
                 requested_voice_prompt_path = os.path.join(self.voice_prompt_dir, voice_prompt_filename)
             # If the voice prompt file does not exist, find a valid (s0) voiceprompt file in the directory
-            if requested_voice_prompt_path is None or not os.path.exists(requested_voice_prompt_path):
+            # Loaded voice prompts skip the per-connection stat
+            if requested_voice_prompt_path is None or (
+                    requested_voice_prompt_path not in self._voice_cache
+                    and not os.path.exists(requested_voice_prompt_path)):
                 raise FileNotFoundError(
                     f"Requested voice prompt '{voice_prompt_filename}' not found in '{self.voice_prompt_dir}'"
                 )
@@ -163,11 +324,7 @@ class ServerState:
                 voice_prompt_path = requested_voice_prompt_path
                 
         if self.lm_gen.voice_prompt != voice_prompt_path:
-            if voice_prompt_path.endswith('.pt'):
-                # Load pre-saved voice prompt embeddings
-                self.lm_gen.load_voice_prompt_embeddings(voice_prompt_path)
-            else:
-                self.lm_gen.load_voice_prompt(voice_prompt_path)
+            self._select_voice_prompt(voice_prompt_path)
         self.lm_gen.text_prompt_tokens = self.text_tokenizer.encode(wrap_with_system_tags(request.query["text_prompt"])) if len(request.query["text_prompt"]) > 0 else None
         seed = int(request["seed"]) if "seed" in request.query else None
 
@@ -195,58 +352,80 @@ class ServerState:
                     kind = message[0]
                     if kind == 1:  # audio
                         payload = message[1:]
-                        opus_reader.append_bytes(payload)
+                        await loop.run_in_executor(opus_exec, opus_reader.append_bytes, payload)
+                        pcm_available.set()
                     else:
                         clog.log("warning", f"unknown message kind {kind}")
             finally:
                 close = True
+                # Wake opus_loop so it can notice the close
+                pcm_available.set()
                 clog.log("info", "connection closed")
 
         async def opus_loop():
-            all_pcm_data = None
+            # Preallocated PCM buffer with read/write cursors. Pending samples are moved
+            # back to the front only when a write would run past the end, so each frame
+            # costs O(frame_size) instead of re-concatenating everything still buffered.
+            pcm_buf = np.empty(self.frame_size * 32, dtype=np.float32)
+            read_idx = 0
+            write_idx = 0
 
             while True:
                 if close:
                     return
-                await asyncio.sleep(0.001)
-                pcm = opus_reader.read_pcm()
-                if pcm.shape[-1] == 0:
+                # Sleep until recv_loop hands over new opus bytes instead of polling
+                await pcm_available.wait()
+                pcm_available.clear()
+                if close:
+                    return
+                pcm = await loop.run_in_executor(opus_exec, opus_reader.read_pcm)
+                n = pcm.shape[-1]
+                if n == 0:
                     continue
-                if all_pcm_data is None:
-                    all_pcm_data = pcm
-                else:
-                    all_pcm_data = np.concatenate((all_pcm_data, pcm))
-                while all_pcm_data.shape[-1] >= self.frame_size:
-                    chunk = all_pcm_data[: self.frame_size]
-                    all_pcm_data = all_pcm_data[self.frame_size:]
-                    chunk = torch.from_numpy(chunk)
-                    chunk = chunk.to(device=self.device)[None, None]
-                    codes = self.mimi.encode(chunk)
-                    for c in range(codes.shape[-1]):
-                        tokens = self.lm_gen.step(codes[:, :, c: c + 1])
-                        if tokens is None:
-                            continue
-                        assert tokens.shape[1] == self.lm_gen.lm_model.dep_q + 1
-                        main_pcm = self.mimi.decode(tokens[:, 1:9])
-                        main_pcm = main_pcm.cpu()
-                        opus_writer.append_pcm(main_pcm[0, 0].numpy())
-                        text_token = tokens[0, 0, 0].item()
-                        if text_token not in (0, 3):
-                            _text = self.text_tokenizer.id_to_piece(text_token)  # type: ignore
-                            _text = _text.replace("▁", " ")
-                            msg = b"\x02" + bytes(_text, encoding="utf8")
-                            await ws.send_bytes(msg)
+                if write_idx + n > pcm_buf.shape[-1]:
+                    pending = write_idx - read_idx
+                    if pending + n > pcm_buf.shape[-1]:
+                        # Burst larger than the buffer: grow it
+                        new_buf = np.empty(max(2 * pcm_buf.shape[-1], pending + n), dtype=np.float32)
+                        new_buf[:pending] = pcm_buf[read_idx:write_idx]
+                        pcm_buf = new_buf
+                    else:
+                        pcm_buf[:pending] = pcm_buf[read_idx:write_idx]
+                    read_idx = 0
+                    write_idx = pending
+                pcm_buf[write_idx:write_idx + n] = pcm
+                write_idx += n
+                # Decoded frame waiting to be sent. When several frames are buffered, it is
+                # only collected after the next LM step is queued, so the Mimi decode on the
+                # side stream overlaps that step. A lone frame is flushed right away.
+                pending = None
+                while write_idx - read_idx >= self.frame_size:
+                    chunk = self._upload_chunk(pcm_buf[read_idx:read_idx + self.frame_size])
+                    read_idx += self.frame_size
+                    tokens = self._step_lm(chunk)
+                    if pending is not None:
+                        await send_frame(*pending)
+                        pending = None
+                    if tokens is not None:
+                        pending = (self._decode(tokens), tokens)
                     # Yield control to keep event loop responsive
                     await asyncio.sleep(0)
+                if pending is not None:
+                    await send_frame(*pending)
 
-        async def send_loop():
-            while True:
-                if close:
-                    return
-                await asyncio.sleep(0.001)  # Fast polling for smooth audio
-                msg = opus_writer.read_bytes()
-                if len(msg) > 0:
-                    await ws.send_bytes(b"\x01" + msg)
+        async def send_frame(main_pcm: torch.Tensor, tokens: torch.Tensor):
+            pcm_host, text_token = await self._fetch_frame_outputs(main_pcm, tokens)
+            # Send encoded audio as soon as it exists rather than from a polling loop
+            msg = await loop.run_in_executor(opus_exec, encode_pcm, pcm_host)
+            if len(msg) > 0:
+                await ws.send_bytes(b"\x01" + msg)
+            if text_token not in (0, 3):
+                await ws.send_bytes(self._piece_msgs[text_token])
+
+        def encode_pcm(pcm: np.ndarray) -> bytes:
+            # append_pcm copies into the writer, so the pinned buffer can be reused
+            opus_writer.append_pcm(pcm)
+            return opus_writer.read_bytes()
 
         clog.log("info", "accepted connection")
         if len(request.query["text_prompt"]) > 0:
@@ -254,12 +433,25 @@ class ServerState:
         if len(request.query["voice_prompt"]) > 0:
             clog.log("info", f"voice prompt: {voice_prompt_path} (requested: {requested_voice_prompt_path})")
         close = False
+        pcm_available = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        # Sessions are serialized: LMGen, Mimi and their CUDA graphs hold a single batch-1
+        # streaming state, and the voice/text prompts are replayed into it per session.
+        if self.lock.locked():
+            clog.log("info", "model busy with another session, waiting")
+        wait_start = time.perf_counter()
         async with self.lock:
+            wait_time = time.perf_counter() - wait_start
+            if wait_time > 0.1:
+                clog.log("info", f"waited {wait_time:.1f}s for the model")
             if seed is not None and seed != -1:
                 seed_all(seed)
 
             opus_writer = sphn.OpusStreamWriter(self.mimi.sample_rate)
             opus_reader = sphn.OpusStreamReader(self.mimi.sample_rate)
+            if self.device.type == 'cuda':
+                # A cancelled session may still have a decode in flight on the side stream
+                torch.cuda.current_stream().wait_stream(self._mimi_stream)
             self.mimi.reset_streaming()
             self.other_mimi.reset_streaming()
             self.lm_gen.reset_streaming()
@@ -285,11 +477,13 @@ class ServerState:
             if await is_alive():
                 await ws.send_bytes(b"\x00")
                 clog.log("info", "sent handshake bytes")
+                # Opus codec work runs off the event loop. A single worker per connection
+                # keeps reader/writer calls serialized, as the sphn objects are not thread-safe.
+                opus_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="opus")
                 # Clean cancellation manager
                 tasks = [
                     asyncio.create_task(recv_loop()),
                     asyncio.create_task(opus_loop()),
-                    asyncio.create_task(send_loop()),
                 ]
 
                 done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
@@ -300,9 +494,10 @@ class ServerState:
                         await task
                     except asyncio.CancelledError:
                         pass
+                opus_exec.shutdown(wait=False)
                 await ws.close()
                 clog.log("info", "session closed")
-                # await asyncio.gather(opus_loop(), recv_loop(), send_loop())
+                # await asyncio.gather(opus_loop(), recv_loop())
         clog.log("info", "done with connection")
         return ws
 
@@ -393,8 +588,7 @@ def _get_static_path(static: Optional[str], hf_repo: str) -> Optional[str]:
         except Exception as e:
             logger.warning(f"Could not download static content from HuggingFace: {e}")
             # Try to find local client/dist folder
-            script_dir = Path(__file__).parent.parent.parent
-            local_dist = script_dir / "client" / "dist"
+            local_dist = _CLIENT_DIR / "dist"
             if local_dist.exists():
                 logger.info(f"Using local client dist: {local_dist}")
                 return str(local_dist)
@@ -407,7 +601,105 @@ def _get_static_path(static: Optional[str], hf_repo: str) -> Optional[str]:
     return None
 
 
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}, e.g. "br;q=0, gzip"."""
+    codings = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding] = q
+    return codings
+
+
+@dataclass(frozen=True)
+class _StaticAsset:
+    """An HTTP asset held in memory with its precompressed variants and a strong ETag.
+    Bodies and response headers are all computed up front; serving is a lookup."""
+    variants: dict[str, tuple[bytes, dict[str, str]]]  # content-coding -> (body, headers), best first
+    not_modified_headers: dict[str, str]
+    etag: str
+    mtime: Optional[float] = None
+
+    @classmethod
+    def from_bytes(cls, body: bytes, content_type: str, cache_control: str,
+                   mtime: Optional[float] = None) -> "_StaticAsset":
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {"Content-Type": content_type, "Cache-Control": cache_control,
+                   "Vary": "Accept-Encoding", "ETag": etag}
+        if mtime is not None:
+            headers["Last-Modified"] = formatdate(mtime, usegmt=True)
+        bodies = {}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(body, quality=11)
+        bodies["gzip"] = gzip.compress(body, 9)
+        bodies["identity"] = body
+        variants = {}
+        for coding, data in bodies.items():
+            variant_headers = dict(headers, **{"Content-Length": str(len(data))})
+            if coding != "identity":
+                variant_headers["Content-Encoding"] = coding
+            variants[coding] = (data, variant_headers)
+        return cls(variants=variants, not_modified_headers=headers, etag=etag, mtime=mtime)
+
+    @classmethod
+    def from_file(cls, path: Path, content_type: str, cache_control: str) -> "_StaticAsset":
+        return cls.from_bytes(path.read_bytes(), content_type, cache_control, mtime=path.stat().st_mtime)
+
+    def _not_modified(self, request: web.Request) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+            return self.etag in if_none_match
+        since = request.if_modified_since
+        return since is not None and self.mtime is not None and int(self.mtime) <= since.timestamp()
+
+    def response(self, request: web.Request) -> web.Response:
+        if self._not_modified(request):
+            return web.Response(status=304, headers=self.not_modified_headers)
+        accepted = _parse_accept_encoding(request.headers.get("Accept-Encoding", ""))
+        default_q = accepted.get("*", 0.0)
+        # identity is always last and always acceptable
+        for coding, (body, headers) in self.variants.items():
+            if coding == "identity" or accepted.get(coding, default_q) > 0:
+                return web.Response(body=body, headers=headers)
+        raise AssertionError("identity variant missing")
+
+
+class _QuietAccessLogger(AccessLogger):
+    """Access logger that skips the page and its static assets, which every reload hits."""
+
+    def log(self, request, response, time):
+        if request.path == "/" or request.path.startswith("/assets/"):
+            return
+        super().log(request, response, time)
+
+
+def _enable_inductor_cache() -> Path:
+    """Persist Inductor / Triton compilation artifacts across server restarts.
+
+    Must run before the first torch.compile call. Existing environment values win.
+    CUDA graph captures are not persisted and are still redone during warmup.
+    """
+    cache_dir = Path(os.environ.setdefault(
+        "TORCHINDUCTOR_CACHE_DIR", str(Path.home() / ".cache" / "personaplex" / "inductor")))
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+    os.environ.setdefault("TORCHINDUCTOR_AUTOGRAD_CACHE", "1")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def main():
+    inductor_cache_dir = _enable_inductor_cache()
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", default="localhost", type=str)
     parser.add_argument("--port", default=8998, type=int)
@@ -426,6 +718,12 @@ def main():
     parser.add_argument("--cpu-offload", action="store_true",
                         help="Offload LM model layers to CPU when GPU memory is insufficient. "
                              "Requires 'accelerate' package.")
+    parser.add_argument("--quantize-int8", action="store_true",
+                        help="Apply dynamic int8 quantization to the LM output and projection layers. "
+                             "Only used when running on CPU.")
+    parser.add_argument("--compile-mimi", action="store_true",
+                        help="torch.compile the Mimi convolutional encoder/decoder. "
+                             "Slower startup, lower per-frame latency. Known to fail on some torch versions.")
     parser.add_argument(
         "--voice-prompt-dir",
         type=str,
@@ -445,6 +743,8 @@ def main():
     )
 
     args = parser.parse_args()
+    cache_bytes = sum(f.stat().st_size for f in inductor_cache_dir.rglob("*") if f.is_file())
+    logger.info(f"inductor cache = {inductor_cache_dir} ({cache_bytes / 1e6:.1f} MB)")
     args.voice_prompt_dir = _get_voice_prompt_dir(
         args.voice_prompt_dir,
         args.hf_repo,
@@ -497,7 +797,7 @@ def main():
     if args.mimi_weight is None:
         args.mimi_weight = hf_hub_download(args.hf_repo, loaders.MIMI_NAME, token=hf_token)
     mimi = loaders.get_mimi(args.mimi_weight, args.device)
-    other_mimi = loaders.get_mimi(args.mimi_weight, args.device)
+    other_mimi = loaders.get_mimi_sharing_weights(mimi)
     logger.info("mimi loaded")
 
     if args.tokenizer is None:
@@ -509,6 +809,12 @@ def main():
         args.moshi_weight = hf_hub_download(args.hf_repo, loaders.MOSHI_NAME, token=hf_token)
     lm = loaders.get_moshi_lm(args.moshi_weight, device=args.device, cpu_offload=args.cpu_offload)
     lm.eval()
+    if args.quantize_int8:
+        if args.device.type == "cpu":
+            n_quantized = loaders.quantize_lm_int8_dynamic(lm)
+            logger.info(f"quantized {n_quantized} linear layers to int8")
+        else:
+            logger.warning("--quantize-int8 only applies on CPU, ignoring")
     logger.info("moshi loaded")
     state = ServerState(
         mimi=mimi,
@@ -518,29 +824,38 @@ def main():
         device=args.device,
         voice_prompt_dir=args.voice_prompt_dir,
         save_voice_prompt_embeddings=False,
+        compile_mimi=args.compile_mimi,
     )
+    state.preload_voice_prompts()
     logger.info("warming up the model")
     state.warmup()
-    app = web.Application()
+    # Larger per-connection read buffer so bursts of queued client audio are parsed in
+    # fewer event loop iterations (run_app has no handler_args in aiohttp 3.10)
+    app = web.Application(handler_args={"read_bufsize": 2**20})
     app.router.add_get("/api/chat", state.handle_chat)
     if static_path is not None:
+        index_path = os.path.join(static_path, "index.html")
+
         async def handle_root(_):
-            return web.FileResponse(os.path.join(static_path, "index.html"))
+            return web.FileResponse(index_path, chunk_size=_STATIC_CHUNK_SIZE)
 
         logger.info(f"serving static content from {static_path}")
         app.router.add_get("/", handle_root)
         app.router.add_static(
-            "/", path=static_path, follow_symlinks=True, name="static"
+            "/", path=static_path, follow_symlinks=True, name="static", chunk_size=_STATIC_CHUNK_SIZE
         )
     else:
         # Serve embedded web client when no built static content is available
-        async def handle_embedded_client(_):
-            html = """<!DOCTYPE html>
+        html = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>PersonaPlex - SurAiverse Edition</title>
+    <!-- Fetch the Opus worker scripts while the user is still on the setup view -->
+    <link rel="prefetch" href="/assets/decoderWorker.min.js">
+    <link rel="prefetch" href="/assets/decoderWorker.min.wasm">
+    <link rel="prefetch" href="https://cdn.jsdelivr.net/npm/opus-recorder@8.0.5/dist/encoderWorker.min.js" crossorigin>
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Fraunces:opsz,wght@9..144,300..700&family=Source+Serif+4:opsz,wght@8..60,300..700&display=swap');
         * { box-sizing: border-box; margin: 0; padding: 0; }
@@ -585,6 +900,7 @@ def main():
         .form-group textarea:focus, .form-group select:focus { 
             outline: none; border-color: #9a7a3a; box-shadow: 0 0 0 3px rgba(198,161,91,0.2); }
         .form-group textarea { min-height: 100px; resize: vertical; }
+        .form-group label.checkbox-label { display: flex; align-items: center; gap: 8px; margin-bottom: 0; cursor: pointer; }
         .char-count { text-align: right; font-size: 0.8em; color: #888; margin-top: 4px; }
         
         /* Preset buttons */
@@ -619,15 +935,18 @@ def main():
         .visualizer-container { display: flex; gap: 30px; justify-content: center; margin: 30px 0; }
         .visualizer { width: 140px; height: 140px; border-radius: 50%; display: flex; align-items: center; 
                       justify-content: center; position: relative; background: rgba(255,255,255,0.85); 
-                      box-shadow: 0 4px 20px rgba(0,0,0,0.1); }
+                      box-shadow: 0 4px 20px rgba(0,0,0,0.1); contain: layout; }
         .visualizer.ai { border: 3px solid #00a8cc; }
         .visualizer.user { border: 3px solid #76b900; }
         .visualizer-label { position: absolute; bottom: -30px; font-size: 0.9em; color: #666; font-weight: 500; }
+        /* The ring is its own compositor layer and only transform/opacity change while it pulses.
+           Its color is fixed up front (hidden through opacity) so nothing else restyles mid-animation. */
         .visualizer-ring { position: absolute; width: 100%; height: 100%; border-radius: 50%; 
-                          border: 3px solid transparent; }
-        .visualizer.active .visualizer-ring { animation: ring-pulse 0.5s infinite; }
-        .visualizer.ai.active .visualizer-ring { border-color: #00a8cc; }
-        .visualizer.user.active .visualizer-ring { border-color: #76b900; }
+                          border: 3px solid transparent; opacity: 0;
+                          will-change: transform, opacity; transform: translateZ(0); }
+        .visualizer.active .visualizer-ring { animation: ring-pulse 0.4s 1; }
+        .visualizer.ai .visualizer-ring { border-color: #00a8cc; }
+        .visualizer.user .visualizer-ring { border-color: #76b900; }
         @keyframes ring-pulse { 0% { transform: scale(1); opacity: 1; } 100% { transform: scale(1.3); opacity: 0; } }
         
         .transcript { background: rgba(255,255,255,0.9); border-radius: 12px; padding: 20px; min-height: 100px; 
@@ -661,6 +980,13 @@ def main():
     </style>
 </head>
 <body>
+    <!-- Mic icon defined once; every visible copy references it with <use> -->
+    <svg style="display: none;">
+        <symbol id="micIcon" viewBox="0 0 24 24">
+            <path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/>
+            <path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/>
+        </symbol>
+    </svg>
     <div class="header">
         <h1>PersonaPlex</h1>
         <div class="brand-tagline">Simplified &amp; one-click install by SurAiverse</div>
@@ -691,10 +1017,10 @@ def main():
                     <div class="presets-container">
                         <span class="presets-label">Examples:</span>
                         <div class="presets">
-                            <button class="preset-btn" onclick="setPreset('assistant')">Assistant (default)</button>
-                            <button class="preset-btn" onclick="setPreset('medical')">Medical office (service)</button>
-                            <button class="preset-btn" onclick="setPreset('bank')">Bank (service)</button>
-                            <button class="preset-btn" onclick="setPreset('astronaut')">Astronaut (fun)</button>
+                            <button class="preset-btn" data-preset="assistant">Assistant (default)</button>
+                            <button class="preset-btn" data-preset="medical">Medical office (service)</button>
+                            <button class="preset-btn" data-preset="bank">Bank (service)</button>
+                            <button class="preset-btn" data-preset="astronaut">Astronaut (fun)</button>
                         </div>
                     </div>
                     <div class="form-group">
@@ -727,17 +1053,21 @@ def main():
                             <option value="VARM4.pt">VARIETY_M4</option>
                         </select>
                     </div>
+                    <div class="form-group">
+                        <label class="checkbox-label">
+                            <input type="checkbox" id="recordSession"> Record the conversation for download
+                        </label>
+                    </div>
                 </div>
                 
                 <div class="error-msg" id="errorMsg"></div>
                 
                 <div class="btn-container">
-                    <button class="btn btn-primary" id="connectBtn" onclick="startConversation()">
+                    <button class="btn btn-primary" id="connectBtn">
                         <svg class="mic-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                            <path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/>
-                            <path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/>
+                            <use href="#micIcon"/>
                         </svg>
-                        Connect
+                        <span id="connectBtnLabel">Connect</span>
                     </button>
                 </div>
             </div>
@@ -756,16 +1086,14 @@ def main():
             <div class="visualizer-container">
                 <div class="visualizer ai" id="aiVisualizer">
                     <svg width="50" height="50" viewBox="0 0 24 24" fill="none" stroke="#00a8cc" stroke-width="2">
-                        <path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/>
-                        <path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/>
+                        <use href="#micIcon"/>
                     </svg>
                     <div class="visualizer-ring"></div>
                     <span class="visualizer-label">AI</span>
                 </div>
                 <div class="visualizer user" id="userVisualizer">
                     <svg width="50" height="50" viewBox="0 0 24 24" fill="none" stroke="#76b900" stroke-width="2">
-                        <path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/>
-                        <path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/>
+                        <use href="#micIcon"/>
                     </svg>
                     <div class="visualizer-ring"></div>
                     <span class="visualizer-label">You</span>
@@ -778,10 +1106,10 @@ def main():
             </div>
             
             <div class="controls">
-                <button class="btn btn-danger" id="stopBtn" onclick="stopConversation()">
+                <button class="btn btn-danger" id="stopBtn">
                     Disconnect
                 </button>
-                <button class="btn btn-primary" id="newConvBtn" onclick="newConversation()" style="display:none;">
+                <button class="btn btn-primary" id="newConvBtn" style="display:none;">
                     New Conversation
                 </button>
             </div>
@@ -805,12 +1133,12 @@ def main():
     <script src="https://cdn.jsdelivr.net/npm/opus-recorder@8.0.5/dist/recorder.min.js"></script>
     <script>
         // Text prompt presets
-        const PRESETS = {
+        const PRESETS = Object.freeze({
             assistant: "You are a wise and friendly teacher. Answer questions or provide advice in a clear and engaging way.",
             medical: "You work for Dr. Jones's medical office, and you are receiving calls to record information for new patients. Information: Record full name, date of birth, any medication allergies, tobacco smoking history, alcohol consumption history, and any prior medical conditions. Assure the patient that this information will be confidential, if they ask.",
             bank: "You work for First Neuron Bank which is a bank and your name is Alexis Kim. Information: The customer's transaction for $1,200 at Home Depot was declined. Verify customer identity. The transaction was flagged due to unusual location (transaction attempted in Miami, FL; customer normally transacts in Seattle, WA).",
             astronaut: "You enjoy having a good conversation. Have a technical discussion about fixing a reactor core on a spaceship to Mars. You are an astronaut on a Mars mission. Your name is Alex. You are already dealing with a reactor core meltdown on a Mars mission. Several ship systems are failing, and continued instability will lead to catastrophic failure. You explain what is happening and you urgently ask for help thinking through how to stabilize the reactor."
-        };
+        });
         
         let socket = null;
         let recorder = null;
@@ -823,15 +1151,35 @@ def main():
         let micStream = null;
         let micSource = null;
         let shouldShowDownload = false;
+        // Reused for every outgoing audio message: 0x01 tag followed by the Opus page
+        let sendBuf = new Uint8Array(4096);
+        sendBuf[0] = 0x01;
+        // Outgoing bytes queued in the WebSocket beyond which mic pages are dropped
+        const MAX_SEND_BACKLOG = 32768;
+        let droppedPages = 0;
         const SAMPLE_RATE = 24000;
+        // Shared by every text message; decoders are stateless between decode() calls
+        const textDecoder = new TextDecoder('utf-8');
+        // Skip the browser's noise suppression and gain control, which add processing
+        // latency. Echo cancellation stays on so the AI does not hear itself on speakers.
+        const MIC_CONSTRAINTS = {
+            echoCancellation: true,
+            noiseSuppression: false,
+            autoGainControl: false,
+            channelCount: 1,
+            sampleRate: SAMPLE_RATE,
+            latency: 0
+        };
         
         // View elements
         const setupView = document.getElementById('setupView');
         const conversationView = document.getElementById('conversationView');
         const textPromptInput = document.getElementById('textPrompt');
         const voicePromptSelect = document.getElementById('voicePrompt');
+        const recordSessionCheckbox = document.getElementById('recordSession');
         const charCount = document.getElementById('charCount');
         const connectBtn = document.getElementById('connectBtn');
+        const connectBtnLabel = document.getElementById('connectBtnLabel');
         const errorMsg = document.getElementById('errorMsg');
         const downloadRow = document.getElementById('downloadRow');
         const downloadLink = document.getElementById('downloadLink');
@@ -852,21 +1200,46 @@ def main():
         const aiVisualizer = document.getElementById('aiVisualizer');
         const userVisualizer = document.getElementById('userVisualizer');
         
+        // One CSS pulse per burst of audio: frames arriving mid-pulse are no-ops, and the
+        // class is dropped when the animation ends instead of from a timer per frame
+        function pulseVisualizer(visualizer) {
+            if (!visualizer.classList.contains('active')) {
+                visualizer.classList.add('active');
+            }
+        }
+        for (const visualizer of [aiVisualizer, userVisualizer]) {
+            visualizer.addEventListener('animationend', () => visualizer.classList.remove('active'));
+        }
+        
         // Initialize character count
         function updateCharCount() {
             charCount.textContent = textPromptInput.value.length;
         }
-        textPromptInput.addEventListener('input', updateCharCount);
+        // Typing updates the counter at most once per animation frame
+        let charCountRaf = 0;
+        textPromptInput.addEventListener('input', () => {
+            if (charCountRaf) return;
+            charCountRaf = requestAnimationFrame(() => {
+                charCountRaf = 0;
+                updateCharCount();
+            });
+        });
         updateCharCount();
         
         // Set preset text
         function setPreset(presetName) {
-            if (PRESETS[presetName]) {
+            if (Object.prototype.hasOwnProperty.call(PRESETS, presetName)) {
                 textPromptInput.value = PRESETS[presetName];
                 updateCharCount();
             }
         }
         
+        // The mic icon stays in the DOM; resetting the button only touches its label
+        function resetConnectBtn() {
+            connectBtn.disabled = false;
+            connectBtnLabel.textContent = 'Connect';
+        }
+        
         function showSetupView() {
             setupView.classList.remove('hidden');
             conversationView.classList.remove('active');
@@ -907,7 +1280,11 @@ def main():
         
         async function initAudio() {
             if (!audioContext) {
-                audioContext = new (window.AudioContext || window.webkitAudioContext)({ sampleRate: SAMPLE_RATE });
+                audioContext = new (window.AudioContext || window.webkitAudioContext)({
+                    sampleRate: SAMPLE_RATE,
+                    latencyHint: 'interactive'
+                });
+                console.log('Audio latency: base', audioContext.baseLatency, 'output', audioContext.outputLatency);
             }
             if (audioContext.state === 'suspended') {
                 await audioContext.resume();
@@ -920,18 +1297,15 @@ def main():
                 shouldShowDownload = false;
                 recordedChunks = [];
                 downloadRow.style.display = 'none';
-                if (!audioContext) {
+                // Opt-in: MediaRecorder re-encodes the mixed audio for the whole session
+                if (!audioContext || !recordSessionCheckbox.checked) {
                     return;
                 }
                 if (!recordingDestination) {
                     recordingDestination = audioContext.createMediaStreamDestination();
                 }
-                try {
-                    micStream = await navigator.mediaDevices.getUserMedia({ audio: true });
-                    micSource = audioContext.createMediaStreamSource(micStream);
+                if (micSource) {
                     micSource.connect(recordingDestination);
-                } catch (err) {
-                    console.warn('Could not attach mic stream to recording:', err);
                 }
 
                 mediaRecorder = new MediaRecorder(recordingDestination.stream);
@@ -962,6 +1336,19 @@ def main():
             if (mediaRecorder && mediaRecorder.state !== 'inactive') {
                 try { mediaRecorder.stop(); } catch (err) {}
             }
+            if (micSource && recordingDestination) {
+                try { micSource.disconnect(recordingDestination); } catch (err) {}
+            }
+        }
+
+        // The microphone is opened once per conversation and shared by the Opus recorder
+        // and the session recording
+        async function openMic() {
+            micStream = await navigator.mediaDevices.getUserMedia({ audio: MIC_CONSTRAINTS });
+            micSource = audioContext.createMediaStreamSource(micStream);
+        }
+
+        function closeMic() {
             if (micSource) {
                 try { micSource.disconnect(); } catch (err) {}
                 micSource = null;
@@ -972,32 +1359,44 @@ def main():
             }
         }
         
-        function createWarmupBosPage() {
-            const opusHead = new Uint8Array([
-                0x4F, 0x70, 0x75, 0x73, 0x48, 0x65, 0x61, 0x64,
-                0x01, 0x01, 0x38, 0x01, 0x80, 0xBB, 0x00, 0x00,
-                0x00, 0x00, 0x00
-            ]);
-            const pageHeader = new Uint8Array([
-                0x4F, 0x67, 0x67, 0x53, 0x00, 0x02,
-                0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-                0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-                0x00, 0x00, 0x00, 0x00, 0x01, 0x13
-            ]);
-            const bosPage = new Uint8Array(pageHeader.length + opusHead.length);
-            bosPage.set(pageHeader, 0);
-            bosPage.set(opusHead, pageHeader.length);
-            return bosPage;
+        // Ogg BOS page carrying the OpusHead header (mono, 48 kHz), used to prime the decoder.
+        // Posted without a transfer list, so the worker gets a copy and this stays intact.
+        const BOS_PAGE = new Uint8Array([
+            // Ogg page header
+            0x4F, 0x67, 0x67, 0x53, 0x00, 0x02,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x00, 0x00, 0x00, 0x00, 0x01, 0x13,
+            // OpusHead
+            0x4F, 0x70, 0x75, 0x73, 0x48, 0x65, 0x61, 0x64,
+            0x01, 0x01, 0x38, 0x01, 0x80, 0xBB, 0x00, 0x00,
+            0x00, 0x00, 0x00
+        ]);
+        
+        function createDecoderWorker() {
+            try {
+                return new Worker('/assets/decoderWorker.min.js');
+            } catch (e) {
+                console.warn('Could not load local decoder, trying CDN...');
+                return new Worker('https://cdn.jsdelivr.net/npm/opus-recorder@8.0.5/dist/decoderWorker.min.js');
+            }
         }
         
+        // Start the decoder worker (script + wasm compile) while the setup view is shown,
+        // so Connect doesn't pay for it. Each conversation consumes it and the next one
+        // creates a fresh worker from the HTTP cache.
+        let warmDecoderWorker = null;
+        (window.requestIdleCallback || setTimeout)(() => {
+            if (!decoderWorker) {
+                warmDecoderWorker = createDecoderWorker();
+            }
+        });
+        
         async function initDecoder() {
             return new Promise((resolve, reject) => {
-                try {
-                    decoderWorker = new Worker('/assets/decoderWorker.min.js');
-                } catch (e) {
-                    console.warn('Could not load local decoder, trying CDN...');
-                    decoderWorker = new Worker('https://cdn.jsdelivr.net/npm/opus-recorder@8.0.5/dist/decoderWorker.min.js');
-                }
+                // Take the worker started in the background if there is one
+                decoderWorker = warmDecoderWorker || createDecoderWorker();
+                warmDecoderWorker = null;
                 
                 decoderWorker.onmessage = (e) => {
                     if (e.data && e.data[0]) {
@@ -1018,59 +1417,98 @@ def main():
                     resampleQuality: 0
                 });
                 
-                setTimeout(() => {
-                    const bosPage = createWarmupBosPage();
-                    decoderWorker.postMessage({ command: 'decode', pages: bosPage });
-                    console.log('Decoder initialized');
-                    resolve();
-                }, 200);
+                // No need to wait for the worker: it handles messages in order once its
+                // wasm module is ready, so the BOS page and later pages queue behind init
+                decoderWorker.postMessage({ command: 'decode', pages: BOS_PAGE });
+                console.log('Decoder initialized');
+                resolve();
             });
         }
         
+        // Played AudioBuffers are recycled; the decoder always emits the same frame length,
+        // so after the first few frames playback allocates no new buffers
+        const playbackBufferPool = [];
+        // Playback scheduling targets, in seconds
+        const TARGET_JITTER = 0.02;
+        const MAX_PLAYBACK_LEAD = 0.15;
+        function getPlaybackBuffer(length) {
+            const buffer = playbackBufferPool.pop();
+            if (buffer && buffer.length === length && buffer.sampleRate === audioContext.sampleRate) {
+                return buffer;
+            }
+            return audioContext.createBuffer(1, length, audioContext.sampleRate);
+        }
+        
         function playDecodedAudio(pcmData) {
             if (!audioContext || !pcmData || pcmData.length === 0) return;
             
-            const buffer = audioContext.createBuffer(1, pcmData.length, audioContext.sampleRate);
-            buffer.getChannelData(0).set(pcmData);
+            const now = audioContext.currentTime;
+            const lead = nextPlayTime - now;
+            if (lead > MAX_PLAYBACK_LEAD) {
+                // Queue grew too deep: drop this frame so latency doesn't ratchet up for the
+                // session. Re-anchoring instead would overlap the frames already scheduled.
+                return;
+            }
+            if (lead < 0) {
+                // Underrun: restart just past the output latency instead of a fixed 50 ms
+                nextPlayTime = now + (audioContext.baseLatency || 0) + TARGET_JITTER;
+            }
+            
+            const buffer = getPlaybackBuffer(pcmData.length);
+            buffer.copyToChannel(pcmData, 0);
             
+            // Source nodes are one-shot, but their buffer goes back to the pool once played
             const source = audioContext.createBufferSource();
             source.buffer = buffer;
+            source.onended = () => playbackBufferPool.push(buffer);
             source.connect(audioContext.destination);
-            if (recordingDestination) {
+            if (recordingDestination && mediaRecorder && mediaRecorder.state === 'recording') {
                 source.connect(recordingDestination);
-            }
-            
-            const now = audioContext.currentTime;
-            if (nextPlayTime < now) {
-                nextPlayTime = now + 0.05;
             }
             
             source.start(nextPlayTime);
             nextPlayTime += buffer.duration;
             
-            aiVisualizer.classList.add('active');
-            setTimeout(() => aiVisualizer.classList.remove('active'), 100);
+            pulseVisualizer(aiVisualizer);
         }
         
+        // Text tokens are buffered and written at most once per animation frame, as a new
+        // text node, so the transcript is never re-serialized and layout runs once per flush
+        let pendingText = '';
+        let flushScheduled = false;
+        function flushTranscript() {
+            flushScheduled = false;
+            if (pendingText.length === 0) return;
+            transcript.appendChild(document.createTextNode(pendingText));
+            pendingText = '';
+            const scroller = transcript.parentElement;
+            scroller.scrollTop = scroller.scrollHeight;
+        }
+        
+        // A view covering its whole buffer is transferred (not copied) and must not be used
+        // by the caller afterwards; any other view is copied first
         function decodeAudio(opusData) {
             if (decoderWorker && opusData.length > 0) {
-                decoderWorker.postMessage({ command: 'decode', pages: opusData }, [opusData.buffer]);
+                // The worker finds Ogg pages with offsets into pages.buffer but slices the
+                // packets out of the view, so the two must line up (offset 0, same length)
+                const pages = opusData.byteOffset === 0 && opusData.byteLength === opusData.buffer.byteLength
+                    ? opusData : opusData.slice();
+                decoderWorker.postMessage({ command: 'decode', pages: pages }, [pages.buffer]);
             }
         }
         
         async function startConversation() {
             try {
                 connectBtn.disabled = true;
-                connectBtn.textContent = 'Connecting...';
+                connectBtnLabel.textContent = 'Connecting...';
                 downloadRow.style.display = 'none';
                 downloadLink.removeAttribute('href');
                 
                 await initAudio();
                 await initDecoder();
                 
-                // Check microphone permission
-                const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-                stream.getTracks().forEach(track => track.stop());
+                // Open the microphone now so a denied permission is reported before connecting
+                await openMic();
                 
                 // Switch to conversation view
                 showConversationView();
@@ -1099,23 +1537,27 @@ def main():
                 };
                 
                 socket.onmessage = (event) => {
-                    const data = new Uint8Array(event.data);
-                    const msgType = data[0];
-                    const payload = data.slice(1);
+                    const buf = event.data;
+                    const msgType = new Uint8Array(buf, 0, 1)[0];
                     
-                    if (msgType === 0x00) {
+                    // Most frequent first. Text is decoded from a view past the tag byte; audio
+                    // is copied once into its own buffer, since the decoder worker needs its
+                    // pages at offset 0 (see decodeAudio), and that buffer is transferred
+                    if (msgType === 0x01) {
+                        decodeAudio(new Uint8Array(buf.slice(1)));
+                    } else if (msgType === 0x02) {
+                        pendingText += textDecoder.decode(new Uint8Array(buf, 1));
+                        if (!flushScheduled) {
+                            flushScheduled = true;
+                            requestAnimationFrame(flushTranscript);
+                        }
+                    } else if (msgType === 0x00) {
                         console.log('Handshake received, starting recording...');
                         setStatus('connected', 'Connected - Speak now!');
                         stopBtn.disabled = false;
                         transcript.textContent = '';
                         startMicRecording();
                         startSessionRecording();
-                    } else if (msgType === 0x01) {
-                        decodeAudio(payload);
-                    } else if (msgType === 0x02) {
-                        const text = new TextDecoder().decode(payload);
-                        transcript.textContent += text;
-                        transcript.scrollTop = transcript.scrollHeight;
                     }
                 };
                 
@@ -1141,8 +1583,8 @@ def main():
                 } else {
                     showError(err.message || 'Failed to start conversation');
                 }
-                connectBtn.disabled = false;
-                connectBtn.innerHTML = '<svg class="mic-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/><path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/></svg> Connect';
+                closeMic();
+                resetConnectBtn();
                 showSetupView();
             }
         }
@@ -1152,10 +1594,13 @@ def main():
                 const encoderPath = 'https://cdn.jsdelivr.net/npm/opus-recorder@8.0.5/dist/encoderWorker.min.js';
                 
                 recorder = new Recorder({
+                    sourceNode: micSource,
                     encoderPath: encoderPath,
                     encoderSampleRate: SAMPLE_RATE,
                     encoderFrameSize: 20,
-                    maxFramesPerPage: 2,
+                    // 4 x 20 ms = one 80 ms Mimi frame per page: the server can't step
+                    // on less anyway, and it halves the number of sends
+                    maxFramesPerPage: 4,
                     numberOfChannels: 1,
                     streamPages: true,
                     encoderApplication: 2049,
@@ -1163,12 +1608,22 @@ def main():
                 
                 recorder.ondataavailable = (data) => {
                     if (socket && socket.readyState === WebSocket.OPEN) {
-                        userVisualizer.classList.add('active');
-                        setTimeout(() => userVisualizer.classList.remove('active'), 100);
-                        const msg = new Uint8Array(1 + data.length);
-                        msg[0] = 0x01;
-                        msg.set(data, 1);
-                        socket.send(msg);
+                        pulseVisualizer(userVisualizer);
+                        if (socket.bufferedAmount > MAX_SEND_BACKLOG) {
+                            // The link is stalled: drop mic audio rather than queue stale speech
+                            droppedPages++;
+                            if (droppedPages % 25 === 1) {
+                                console.warn('Send backlog', socket.bufferedAmount, 'bytes, dropped pages:', droppedPages);
+                            }
+                            return;
+                        }
+                        if (data.length + 1 > sendBuf.length) {
+                            sendBuf = new Uint8Array(data.length + 1);
+                            sendBuf[0] = 0x01;
+                        }
+                        sendBuf.set(data, 1);
+                        // send() copies the bytes, so the scratch buffer can be reused right away
+                        socket.send(sendBuf.subarray(0, data.length + 1));
                     }
                 };
                 
@@ -1188,15 +1643,15 @@ def main():
             cleanup();
             setStatus('disconnected', 'Disconnected');
             setProgress(100, 'Complete', true);
-            transcript.textContent += '\\n\\n[Conversation ended]';
+            flushTranscript();
+            transcript.appendChild(document.createTextNode('\\n\\n[Conversation ended]'));
             stopBtn.style.display = 'none';
             newConvBtn.style.display = 'inline-flex';
         }
         
         function newConversation() {
             showSetupView();
-            connectBtn.disabled = false;
-            connectBtn.innerHTML = '<svg class="mic-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/><path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/></svg> Connect';
+            resetConnectBtn();
             stopBtn.style.display = 'inline-flex';
             newConvBtn.style.display = 'none';
             setProgress(20, 'Ready');
@@ -1210,6 +1665,7 @@ def main():
                 try { recorder.stop(); } catch(e) {}
                 recorder = null;
             }
+            closeMic();
             if (socket) {
                 try { socket.close(); } catch(e) {}
                 socket = null;
@@ -1218,41 +1674,57 @@ def main():
                 try { decoderWorker.terminate(); } catch(e) {}
                 decoderWorker = null;
             }
-            connectBtn.disabled = false;
-            connectBtn.innerHTML = '<svg class="mic-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 2a3 3 0 0 0-3 3v7a3 3 0 0 0 6 0V5a3 3 0 0 0-3-3Z"/><path d="M19 10v2a7 7 0 0 1-14 0v-2"/><line x1="12" x2="12" y1="19" y2="22"/></svg> Connect';
+            resetConnectBtn();
             aiVisualizer.classList.remove('active');
             userVisualizer.classList.remove('active');
             nextPlayTime = 0;
         }
         
+        // Event wiring (no inline handlers): one delegated listener for all presets
+        document.querySelector('.presets').addEventListener('click', (e) => {
+            const btn = e.target.closest('[data-preset]');
+            if (btn) setPreset(btn.dataset.preset);
+        }, { passive: true });
+        connectBtn.addEventListener('click', startConversation, { passive: true });
+        stopBtn.addEventListener('click', stopConversation, { passive: true });
+        newConvBtn.addEventListener('click', newConversation, { passive: true });
+        
         // Handle page unload
         window.addEventListener('beforeunload', cleanup);
     </script>
 </body>
 </html>"""
-            return web.Response(text=html, content_type='text/html')
+        # Encoded, compressed and hashed once; requests only pick a variant or answer 304.
+        # no-cache rather than max-age: the page changes with the server version, and
+        # revalidation is a bodiless 304 anyway.
+        html_asset = _StaticAsset.from_bytes(
+            html.encode("utf-8"), "text/html; charset=utf-8", cache_control="no-cache")
+
+        async def handle_embedded_client(request):
+            return html_asset.response(request)
         
         logger.info("Serving embedded web client (no build required)")
         app.router.add_get("/", handle_embedded_client)
         
         # Serve decoder files from client/public/assets if they exist
-        script_dir = Path(__file__).parent.parent.parent
-        decoder_path = script_dir / "client" / "public" / "assets"
+        decoder_path = _CLIENT_DIR / "public" / "assets"
         if decoder_path.exists():
-            async def serve_decoder_js(_):
-                file_path = decoder_path / "decoderWorker.min.js"
-                if file_path.exists():
-                    return web.FileResponse(file_path)
-                return web.Response(status=404)
-            
-            async def serve_decoder_wasm(_):
-                file_path = decoder_path / "decoderWorker.min.wasm"
-                if file_path.exists():
-                    return web.FileResponse(file_path, headers={'Content-Type': 'application/wasm'})
-                return web.Response(status=404)
-            
-            app.router.add_get("/assets/decoderWorker.min.js", serve_decoder_js)
-            app.router.add_get("/assets/decoderWorker.min.wasm", serve_decoder_wasm)
+            # Read and hashed once; conditional GETs on reload are answered with a 304.
+            # The names are not content-hashed, so no `immutable`: clients revalidate daily.
+            decoder_cache_control = "public, max-age=86400"
+            # A file missing at startup gets no route at all (aiohttp answers 404 itself)
+            for filename, content_type in (("decoderWorker.min.js", "application/javascript"),
+                                           ("decoderWorker.min.wasm", "application/wasm")):
+                file_path = decoder_path / filename
+                if not file_path.exists():
+                    logger.warning(f"{file_path} not found, /assets/{filename} will not be served")
+                    continue
+                asset = _StaticAsset.from_file(file_path, content_type, decoder_cache_control)
+
+                async def serve_asset(request, asset=asset):
+                    return asset.response(request)
+
+                app.router.add_get(f"/assets/{filename}", serve_asset)
             logger.info(f"Serving decoder files from {decoder_path}")
     protocol = "http"
     ssl_context = None
@@ -1263,8 +1735,21 @@ def main():
     if setup_tunnel is not None:
         tunnel = setup_tunnel('localhost', args.port, tunnel_token, None)
         logger.info(f"Tunnel started, if executing on a remote GPU, you can use {tunnel}.")
-    web.run_app(app, port=args.port, ssl_context=ssl_context)
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio event loop")
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("using uvloop event loop")
+    # A deeper accept backlog for reconnect storms; keep-alive long enough that page,
+    # assets and the WS upgrade reuse one connection across a reload.
+    web.run_app(app, port=args.port, ssl_context=ssl_context, access_log_class=_QuietAccessLogger,
+                backlog=1024, keepalive_timeout=120)
 
 
-with torch.no_grad():
+# inference_mode rather than no_grad: it also skips version counters and view tracking.
+# Everything (model loading, warmup/graph capture and the request handlers) must run under
+# the same mode, since inference tensors can't be updated in-place outside of it.
+with torch.inference_mode():
     main()
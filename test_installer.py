@@ -7,8 +7,11 @@ Created by SurAiverse - https://www.youtube.com/@suraiverse
 """
 
 import os
+import re
 import sys
 import ast
+import mmap
+import importlib.util
 import subprocess
 from pathlib import Path
 
@@ -22,9 +25,14 @@ def print_banner():
     print()
 
 
-def check_file_exists(filepath: str, description: str) -> bool:
-    """Check if a file exists"""
-    if os.path.exists(filepath):
+def check_file_exists(filepath: str, description: str, existing: set | None = None) -> bool:
+    """Check if a file exists.
+
+    ``existing`` is an optional set of the names in the file's directory (see
+    ``list_dir_names``), so the check is a set lookup instead of a stat call.
+    """
+    found = os.path.basename(filepath) in existing if existing is not None else os.path.exists(filepath)
+    if found:
         print(f"   [OK] {description}")
         return True
     else:
@@ -32,6 +40,15 @@ def check_file_exists(filepath: str, description: str) -> bool:
         return False
 
 
+def list_dir_names(directory: Path) -> set:
+    """Names of all entries in a directory, read with a single scandir"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 def check_python_syntax(filepath: str) -> bool:
     """Check if a Python file has valid syntax"""
     try:
@@ -48,10 +65,30 @@ def check_python_syntax(filepath: str) -> bool:
         return False
 
 
+# Builtin and standard library modules ship with the interpreter, no lookup needed.
+# tkinter is left out: it is an optional component of the Windows installer.
+_KNOWN = (frozenset(sys.builtin_module_names)
+          | frozenset(getattr(sys, 'stdlib_module_names', ()))) - {'tkinter'}
+
+# Packages whose pure-Python part can be present while the native part they need is
+# missing; the spec lookup checks the native module instead.
+_NATIVE_PARTS = {
+    'tkinter': '_tkinter',
+}
+
+
 def check_import(module_name: str) -> bool:
-    """Check if a module can be imported"""
+    """Check if a module can be imported
+
+    Only locates the module with ``find_spec``; its top-level code is not run.
+    """
+    if module_name in _KNOWN:
+        print(f"   [OK] Import: {module_name}")
+        return True
     try:
-        __import__(module_name)
+        probe = _NATIVE_PARTS.get(module_name, module_name)
+        if importlib.util.find_spec(probe) is None:
+            raise ImportError(f"No module named '{probe}'")
         print(f"   [OK] Import: {module_name}")
         return True
     except ImportError as e:
@@ -66,6 +103,9 @@ def main():
     all_ok = True
     warnings = 0
     
+    # The batch, Python and PowerShell files all live next to this script
+    top_level = list_dir_names(script_dir)
+    
     # 1. Check batch files
     print("1. Checking Batch Files")
     print("-" * 70)
@@ -81,7 +121,7 @@ def main():
     
     for filename, description in batch_files:
         filepath = script_dir / filename
-        if not check_file_exists(str(filepath), f"{filename} ({description})"):
+        if not check_file_exists(str(filepath), f"{filename} ({description})", top_level):
             all_ok = False
     print()
     
@@ -99,7 +139,7 @@ def main():
     
     for filename in python_files:
         filepath = script_dir / filename
-        if filepath.exists():
+        if filename in top_level:
             if not check_python_syntax(str(filepath)):
                 all_ok = False
         else:
@@ -118,7 +158,7 @@ def main():
     
     for filename, description in ps_files:
         filepath = script_dir / filename
-        if not check_file_exists(str(filepath), f"{filename} ({description})"):
+        if not check_file_exists(str(filepath), f"{filename} ({description})", top_level):
             warnings += 1  # Not critical
     print()
     
@@ -200,22 +240,20 @@ def main():
     print("7. Checking SurAiverse Branding")
     print("-" * 70)
     
-    branding_strings = [
-        "suraiverse",
-        "SurAiverse",
-        "youtube.com/@suraiverse",
-    ]
+    # Case-insensitive, so this also covers "SurAiverse" and the YouTube handle
+    branding_pattern = re.compile(rb"suraiverse", re.IGNORECASE)
     
     files_to_check = batch_files + [(f, "") for f in python_files]
     branded_files = 0
     
     for filename, _ in files_to_check:
         filepath = script_dir / filename
-        if filepath.exists():
+        if filename in top_level:
             try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-                if any(brand.lower() in content.lower() for brand in branding_strings):
-                    branded_files += 1
+                # One search over the mapped bytes: no read, decode or lowercased copy
+                with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if branding_pattern.search(mm):
+                        branded_files += 1
             except:
                 pass
     
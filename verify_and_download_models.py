@@ -10,17 +10,50 @@ Created by SurAiverse - https://www.youtube.com/@suraiverse
 import os
 import sys
 import json
+import mmap
+import struct
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Use the parallel Rust downloader when it is installed. huggingface_hub reads these at
+# import time and refuses HF_HUB_ENABLE_HF_TRANSFER=1 without the package, so check first.
+try:
+    import hf_transfer  # noqa: F401
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    HF_TRANSFER_AVAILABLE = True
+except ImportError:
+    HF_TRANSFER_AVAILABLE = False
+os.environ.setdefault("HF_HUB_DOWNLOAD_TIMEOUT", "60")
+
 try:
     from huggingface_hub import hf_hub_download, hf_hub_url, try_to_load_from_cache
     from huggingface_hub.utils import HfHubHTTPError, GatedRepoError
+    from huggingface_hub.constants import HF_HUB_CACHE
     HF_AVAILABLE = True
 except ImportError:
     HF_AVAILABLE = False
     print("[WARNING] huggingface_hub not installed. Install with: pip install huggingface_hub")
 
+# Prefer orjson for JSON (de)serialization when it is installed
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(bytes(data))
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Little-endian u64 header length at the start of a safetensors file
+_unpack_u64 = struct.Struct("<Q").unpack_from
+
 # Required files from the PersonaPlex model repository (NVIDIA)
 HF_REPO = "nvidia/personaplex-7b-v1"
 CONFIG_FILE = "model_config.json"
@@ -60,23 +93,44 @@ def print_banner():
     print("=" * 70)
 
 
+def print_success():
+    """Print the all-models-ready message"""
+    print("\n[SUCCESS] All required models are ready!")
+    print("\nYou can now launch the server with:")
+    print("  START_PERSONAPLEX.bat")
+    print("  or: .\\launch_server.ps1")
+    print()
+    print("=" * 70)
+    print("Subscribe for more AI tutorials: youtube.com/@suraiverse")
+    print("=" * 70)
+
+
+# Last configuration loaded or saved by this process
+_config_cache: dict | None = None
+
+
 def load_config() -> dict:
-    """Load model configuration"""
-    config_path = Path(__file__).parent / CONFIG_FILE
-    if config_path.exists():
-        try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+    """Load model configuration (read from disk once, then served from memory)"""
+    global _config_cache
+    if _config_cache is None:
+        config = {}
+        config_path = Path(__file__).parent / CONFIG_FILE
+        if config_path.exists():
+            try:
+                config = _loads(config_path.read_bytes())
+            except Exception:
+                pass
+        _config_cache = config
+    # Callers may modify the result before saving it
+    return dict(_config_cache)
 
 
 def save_config(config: dict):
     """Save model configuration"""
+    global _config_cache
     config_path = Path(__file__).parent / CONFIG_FILE
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    config_path.write_bytes(_dumps(config))
+    _config_cache = dict(config)
 
 
 def get_hf_token() -> str | None:
@@ -107,14 +161,52 @@ def check_file_in_custom_path(custom_path: str, filename: str) -> tuple[bool, st
     return False, None
 
 
-def check_file_status(repo_id: str, filename: str, custom_path: str | None = None) -> tuple[bool, str | None]:
-    """Check if a file exists in cache, custom path, or can be downloaded."""
+def scan_cached_files(repo_id: str) -> dict[str, str]:
+    """Map filename -> path for every file in the local HF cache snapshots of a repo.
+
+    One directory scan per snapshot, shared by all files, instead of a cache lookup per file.
+    Files from the revision `refs/main` points to win over older snapshots.
+    """
+    cache_root = Path(HF_HUB_CACHE) if HF_AVAILABLE else Path.home() / ".cache" / "huggingface" / "hub"
+    repo_dir = cache_root / f"models--{repo_id.replace('/', '--')}"
+    snapshots_dir = repo_dir / "snapshots"
+    if not snapshots_dir.is_dir():
+        return {}
+    
+    try:
+        main_revision = (repo_dir / "refs" / "main").read_text().strip()
+    except OSError:
+        main_revision = None
+    
+    with os.scandir(snapshots_dir) as it:
+        snapshots = sorted((e for e in it if e.is_dir()), key=lambda e: e.name == main_revision)
+    
+    available = {}
+    # main revision last, so it overrides
+    for snapshot in snapshots:
+        with os.scandir(snapshot.path) as it:
+            for entry in it:
+                if entry.is_file():  # follows the blob symlinks, so dangling links are skipped
+                    available[entry.name] = entry.path
+    return available
+
+
+def check_file_status(repo_id: str, filename: str, custom_path: str | None = None,
+                      available: dict[str, str] | None = None) -> tuple[bool, str | None]:
+    """Check if a file exists in cache, custom path, or can be downloaded.
+
+    ``available`` is an optional precomputed :func:`scan_cached_files` result for ``repo_id``.
+    """
     # Check custom path first
     if custom_path:
         exists, path = check_file_in_custom_path(custom_path, filename)
         if exists:
             return True, path
     
+    if available is not None:
+        path = available.get(filename)
+        return path is not None, path
+    
     if not HF_AVAILABLE:
         return False, None
     
@@ -147,27 +239,65 @@ def validate_file(filepath: str, file_info: dict) -> tuple[bool, str]:
     
     # Additional validation for safetensors
     if filepath.endswith(".safetensors"):
+        # Parse the JSON header straight from a read-only mapping. This catches corrupt
+        # headers, and leaves the header pages in the page cache for the model loader.
         try:
-            with open(filepath, "rb") as f:
-                header_size = int.from_bytes(f.read(8), "little")
-                if header_size > 10_000_000:  # Header shouldn't be > 10MB
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_size, = _unpack_u64(mm, 0)
+                if header_size > 10_000_000 or 8 + header_size > size:  # Header shouldn't be > 10MB
                     return False, "Invalid safetensors header"
+                with memoryview(mm)[8:8 + header_size] as header:
+                    _loads(header)
+        except ValueError:
+            return False, "Invalid safetensors header"
         except Exception as e:
             return False, f"Could not validate: {e}"
     
     return True, f"Valid ({size / (1024*1024):.2f} MB)"
 
 
-def download_file(repo_id: str, filename: str, description: str, token: str | None = None) -> str | None:
-    """Download a file from HuggingFace Hub."""
+def configure_http_session():
+    """Use keep-alive connection pools that retry transient HF Hub errors.
+
+    Without retries a single 429/5xx aborts the whole download; sessions are
+    created per thread by huggingface_hub, each with this adapter mounted.
+    """
     if not HF_AVAILABLE:
-        print(f"   [ERROR] huggingface_hub not available")
+        return
+    
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from huggingface_hub import configure_http_backend
+    
+    def backend_factory() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    configure_http_backend(backend_factory=backend_factory)
+
+
+def download_file(repo_id: str, filename: str, description: str, token: str | None = None,
+                  log=print) -> str | None:
+    """Download a file from HuggingFace Hub.
+
+    ``log`` can be swapped for a collector so concurrent downloads don't interleave output.
+    """
+    if not HF_AVAILABLE:
+        log(f"   [ERROR] huggingface_hub not available")
         return None
     
     try:
-        print(f"\n[DOWNLOAD] Downloading {filename}...")
-        print(f"   Description: {description}")
-        print(f"   This may take a while for large files...")
+        log(f"\n[DOWNLOAD] Downloading {filename}...")
+        log(f"   Description: {description}")
+        log(f"   This may take a while for large files...")
         
         file_path = hf_hub_download(
             repo_id=repo_id,
@@ -179,29 +309,29 @@ def download_file(repo_id: str, filename: str, description: str, token: str | No
         
         if file_path and os.path.exists(file_path):
             size_mb = os.path.getsize(file_path) / (1024 * 1024)
-            print(f"   [OK] Downloaded: {file_path}")
-            print(f"   Size: {size_mb:.2f} MB")
+            log(f"   [OK] Downloaded: {file_path}")
+            log(f"   Size: {size_mb:.2f} MB")
             return file_path
         else:
-            print(f"   [ERROR] Download failed")
+            log(f"   [ERROR] Download failed")
             return None
             
     except GatedRepoError:
-        print(f"   [ERROR] Access denied! Please accept the model license at:")
-        print(f"   https://huggingface.co/{repo_id}")
+        log(f"   [ERROR] Access denied! Please accept the model license at:")
+        log(f"   https://huggingface.co/{repo_id}")
         return None
     except HfHubHTTPError as e:
         if hasattr(e, 'response') and e.response.status_code == 401:
-            print(f"   [ERROR] Authentication required!")
-            print(f"   Please set HF_TOKEN or run: huggingface-cli login")
+            log(f"   [ERROR] Authentication required!")
+            log(f"   Please set HF_TOKEN or run: huggingface-cli login")
         elif hasattr(e, 'response') and e.response.status_code == 403:
-            print(f"   [ERROR] Access denied! Please accept the model license at:")
-            print(f"   https://huggingface.co/{repo_id}")
+            log(f"   [ERROR] Access denied! Please accept the model license at:")
+            log(f"   https://huggingface.co/{repo_id}")
         else:
-            print(f"   [ERROR] {e}")
+            log(f"   [ERROR] {e}")
         return None
     except Exception as e:
-        print(f"   [ERROR] Error downloading {filename}: {e}")
+        log(f"   [ERROR] Error downloading {filename}: {e}")
         return None
 
 
@@ -318,34 +448,46 @@ def main(args=None):
     if parsed_args.include_optional:
         all_files.update(OPTIONAL_FILES)
     
+    cached_files = scan_cached_files(HF_REPO)
+    
     for filename, info in all_files.items():
         is_required = filename in REQUIRED_FILES
         prefix = "[REQUIRED]" if is_required else "[OPTIONAL]"
         
-        print(f"\n{prefix} Checking {filename}...")
+        # One write per file rather than one per line (stdout is often a pipe to the GUI)
+        lines = [f"\n{prefix} Checking {filename}..."]
         
         # Check if file exists
         if parsed_args.force:
             exists, path = False, None
         else:
-            exists, path = check_file_status(HF_REPO, filename, custom_path)
+            exists, path = check_file_status(HF_REPO, filename, custom_path, cached_files)
         
         if exists and path:
             # Validate file
             valid, msg = validate_file(path, info)
             if valid:
-                print(f"   [OK] Found: {path}")
-                print(f"   {msg}")
+                lines.append(f"   [OK] Found: {path}")
+                lines.append(f"   {msg}")
                 found_files.append((filename, path))
             else:
-                print(f"   [INVALID] {msg}")
+                lines.append(f"   [INVALID] {msg}")
                 invalid_files.append((filename, info["description"]))
                 if is_required:
                     missing_files.append((filename, info["description"]))
         else:
-            print(f"   [MISSING] Not found in cache or custom path")
+            lines.append(f"   [MISSING] Not found in cache or custom path")
             if is_required:
                 missing_files.append((filename, info["description"]))
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Everything required is already local: nothing to download, skip the optional
+    # file lookups and the size summary
+    if not missing_files and not parsed_args.force:
+        print("\n" + "=" * 70)
+        print(f"Required files: {len(REQUIRED_FILES)}/{len(REQUIRED_FILES)} ready")
+        print_success()
+        return 0
     
     # Download missing files
     if missing_files and not parsed_args.verify_only:
@@ -360,13 +502,33 @@ def main(args=None):
                 print("\n[INFO] Download cancelled. Run this script again when ready.")
                 return 1
         
+        if not HF_TRANSFER_AVAILABLE:
+            print("[INFO] hf_transfer not installed, using the standard downloader "
+                  "(pip install hf_transfer for faster downloads)")
+        
         download_errors = []
-        for filename, description in missing_files:
-            path = download_file(HF_REPO, filename, description, hf_token)
-            if path:
-                found_files.append((filename, path))
-            else:
-                download_errors.append(filename)
+        configure_http_session()
+        # Download concurrently to overlap per-file connection setup and use the full
+        # bandwidth. Each download's messages are buffered and printed once it finishes.
+        def download_buffered(filename: str, description: str) -> tuple[str | None, list[str]]:
+            lines = []
+            path = download_file(HF_REPO, filename, description, hf_token,
+                                 log=lambda *a: lines.append(" ".join(map(str, a))))
+            return path, lines
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(missing_files))) as executor:
+            futures = {
+                executor.submit(download_buffered, filename, description): filename
+                for filename, description in missing_files
+            }
+            for future in as_completed(futures):
+                filename = futures[future]
+                path, lines = future.result()
+                print("\n".join(lines))
+                if path:
+                    found_files.append((filename, path))
+                else:
+                    download_errors.append(filename)
         
         if download_errors:
             print("\n[ERROR] Failed to download:")
@@ -389,7 +551,7 @@ def main(args=None):
         print("=" * 70)
         
         for filename, info in OPTIONAL_FILES.items():
-            exists, path = check_file_status(HF_REPO, filename, custom_path)
+            exists, path = check_file_status(HF_REPO, filename, custom_path, cached_files)
             if exists:
                 print(f"[OK] {filename} - Found")
             else:
@@ -412,14 +574,7 @@ def main(args=None):
     print(f"Total size: {total_size / (1024**3):.2f} GB")
     
     if found_required == required_count:
-        print("\n[SUCCESS] All required models are ready!")
-        print("\nYou can now launch the server with:")
-        print("  START_PERSONAPLEX.bat")
-        print("  or: .\\launch_server.ps1")
-        print()
-        print("=" * 70)
-        print("Subscribe for more AI tutorials: youtube.com/@suraiverse")
-        print("=" * 70)
+        print_success()
         return 0
     else:
         print(f"\n[WARNING] {required_count - found_required} required file(s) are missing.")
@@ -428,5 +583,4 @@ def main(args=None):
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(success)
+    sys.exit(main())
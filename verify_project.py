@@ -8,208 +8,387 @@ Created by SurAiverse - https://www.youtube.com/@suraiverse
 
 import os
 import sys
+import json
+import time
+import hashlib
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
+# Section separators
+SEP = "-" * 70
+DSEP = "=" * 70
 
-def print_banner():
+# Fixed report blocks, each logged as one entry
+BANNER = f"""
+{DSEP}
+       PersonaPlex Project Verification
+       by SurAiverse - https://www.youtube.com/@suraiverse
+{DSEP}
+"""
+
+SUMMARY_HEADER = f"""{DSEP}
+Summary
+{DSEP}"""
+
+SUMMARY_SUCCESS = """
+   [SUCCESS] All checks passed!
+
+   You can now launch PersonaPlex:
+     - Double-click START_PERSONAPLEX.bat
+     - Or run: python -m moshi.server --ssl temp
+"""
+
+SUMMARY_WARNINGS = """
+   [OK] Core components ready ({warnings} warning(s))
+
+   PersonaPlex should work. Check warnings above if issues occur.
+"""
+
+SUMMARY_FAILED = """
+   [WARNING] Some components need attention
+
+   Please fix the issues above before launching.
+   Run INSTALL_PERSONAPLEX.bat to set up missing components.
+"""
+
+FOOTER = f"""{SEP}
+   Subscribe to SurAiverse for AI tutorials!
+   YouTube: https://www.youtube.com/@suraiverse
+{SEP}
+"""
+
+MODEL_REPO = "nvidia/personaplex-7b-v1"
+MODEL_CONFIG_FILE = Path(__file__).parent / "model_config.json"
+
+# Results of the last successful run, reused while the environment is unchanged
+REPORT_CACHE_FILE = Path.home() / ".cache" / "personaplex" / "verify.json"
+REPORT_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+WHOAMI_TIMEOUT = 2.0  # seconds
+
+
+def print_banner(log=print):
     """Print SurAiverse banner"""
-    print()
-    print("=" * 70)
-    print("       PersonaPlex Project Verification")
-    print("       by SurAiverse - https://www.youtube.com/@suraiverse")
-    print("=" * 70)
-    print()
+    log(BANNER)
 
 
 def check_import(module_name, package_name=None):
-    """Check if a Python module can be imported."""
+    """Check if a Python module can be imported.
+
+    Only locates the module with find_spec; its top-level code is not run (the
+    torch and sphn sections do the real imports where they are needed).
+    """
+    # Already imported (e.g. numpy, pulled in by the torch section): nothing to look up
+    if module_name in sys.modules:
+        return True, None
     try:
-        __import__(module_name)
+        if find_spec(module_name) is None:
+            return False, f"No module named '{module_name}'"
         return True, None
-    except ImportError as e:
+    except (ImportError, ValueError) as e:
         return False, str(e)
 
 
-def check_file_exists(filepath):
-    """Check if a file exists."""
-    return os.path.exists(filepath)
+def list_dir_entries(directory):
+    """Map name -> os.DirEntry for a directory, read with a single scandir."""
+    try:
+        with os.scandir(directory or ".") as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def check_file_exists(filepath, entries=None):
+    """Check if a file exists.
+
+    ``entries`` optionally maps directory -> list_dir_entries() result, so the
+    check is a dict lookup instead of a stat call.
+    """
+    if entries is None:
+        return os.path.exists(filepath)
+    dirname, basename = os.path.split(filepath)
+    return basename in entries.get(dirname, {})
 
 
 def get_file_size_mb(filepath):
-    """Get file size in MB."""
-    if os.path.exists(filepath):
-        return os.path.getsize(filepath) / (1024 * 1024)
-    return 0
+    """Get file size in MB (0 if it doesn't exist)."""
+    try:
+        return os.stat(filepath).st_size / (1024 * 1024)
+    except OSError:
+        return 0
 
 
-def main():
-    print_banner()
-    
+def _hf_home():
+    """HuggingFace home directory, resolved the way huggingface_hub does."""
+    if os.getenv("HF_HOME"):
+        return Path(os.path.expanduser(os.getenv("HF_HOME")))
+    return Path(os.path.expanduser(os.getenv("XDG_CACHE_HOME") or "~/.cache")) / "huggingface"
+
+
+def _cached_login_token():
+    """Token saved by `huggingface-cli login`, or None.
+
+    Read straight from the token file so the token checks don't pay for
+    importing huggingface_hub (requests, filelock, tqdm, ...).
+    """
+    try:
+        token_path = os.getenv("HF_TOKEN_PATH")
+        with open(os.path.expanduser(token_path) if token_path else _hf_home() / "token") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _hf_hub_cache():
+    """HuggingFace hub cache directory (HF_HUB_CACHE or <HF home>/hub)."""
+    if os.getenv("HF_HUB_CACHE"):
+        return Path(os.path.expanduser(os.getenv("HF_HUB_CACHE")))
+    return _hf_home() / "hub"
+
+
+def _load_custom_model_path():
+    """Custom model path from model_config.json, or None."""
+    try:
+        with open(MODEL_CONFIG_FILE) as f:
+            return json.load(f).get("custom_model_path")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _early_token_check():
+    """Return the HuggingFace token (HF_TOKEN, HUGGING_FACE_HUB_TOKEN or cached login), or None."""
+    return os.getenv("HF_TOKEN") or os.getenv("HUGGING_FACE_HUB_TOKEN") or _cached_login_token()
+
+
+def check_dependencies(log=print):
+    """Check that the required Python packages are importable. Returns (ok, warning count)."""
     all_ok = True
     warnings = 0
     
-    # 1. Check Python packages
-    print("1. Python Dependencies")
-    print("-" * 70)
-    
-    required_packages = [
-        ("moshi", "moshi-personaplex"),
-        ("torch", "torch"),
-        ("numpy", "numpy"),
-        ("sphn", "sphn"),
-        ("sentencepiece", "sentencepiece"),
-        ("sounddevice", "sounddevice"),
-        ("huggingface_hub", "huggingface-hub"),
-        ("aiohttp", "aiohttp"),
-        ("einops", "einops"),
-        ("safetensors", "safetensors"),
-    ]
+    log("1. Python Dependencies")
+    log(SEP)
     
-    for module, package in required_packages:
+    # module -> package name
+    required_packages = {
+        "moshi": "moshi-personaplex",
+        "torch": "torch",
+        "numpy": "numpy",
+        "sphn": "sphn",
+        "sentencepiece": "sentencepiece",
+        "sounddevice": "sounddevice",
+        "huggingface_hub": "huggingface-hub",
+        "aiohttp": "aiohttp",
+        "einops": "einops",
+        "safetensors": "safetensors",
+    }
+    
+    for module, package in required_packages.items():
         ok, error = check_import(module)
         if ok:
-            print(f"   [OK] {package}")
+            log(f"   [OK] {package}")
         else:
-            print(f"   [MISSING] {package}")
+            log(f"   [MISSING] {package}")
             all_ok = False
-    print()
+    log()
+    return all_ok, warnings
+
+
+def check_torch(log=print):
+    """Check PyTorch and CUDA. Returns (ok, warning count)."""
+    all_ok = True
+    warnings = 0
     
-    # 2. Check CUDA/PyTorch
-    print("2. PyTorch and CUDA")
-    print("-" * 70)
+    log("2. PyTorch and CUDA")
+    log(SEP)
     try:
         import torch
-        print(f"   [OK] PyTorch version: {torch.__version__}")
+        log(f"   [OK] PyTorch version: {torch.__version__}")
         if torch.cuda.is_available():
             cuda_ver = torch.version.cuda
-            gpu_name = torch.cuda.get_device_name(0)
-            gpu_mem = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-            print(f"   [OK] CUDA version: {cuda_ver}")
-            print(f"   [OK] GPU: {gpu_name}")
-            print(f"   [OK] GPU Memory: {gpu_mem:.1f} GB")
+            props = torch.cuda.get_device_properties(0)
+            gpu_name = props.name
+            gpu_mem = props.total_memory / (1024**3)
+            log(f"   [OK] CUDA version: {cuda_ver}")
+            log(f"   [OK] GPU: {gpu_name}")
+            log(f"   [OK] GPU Memory: {gpu_mem:.1f} GB")
         else:
-            print(f"   [WARNING] CUDA not available - will use CPU (slower)")
+            log(f"   [WARNING] CUDA not available - will use CPU (slower)")
             warnings += 1
     except Exception as e:
-        print(f"   [ERROR] PyTorch check failed: {e}")
+        log(f"   [ERROR] PyTorch check failed: {e}")
         all_ok = False
-    print()
+    log()
+    return all_ok, warnings
+
+
+def check_opus(log=print):
+    """Check that the Opus codec from sphn works. Returns (ok, warning count)."""
+    all_ok = True
+    warnings = 0
     
-    # 3. Check Opus
-    print("3. Opus Audio Codec")
-    print("-" * 70)
+    log("3. Opus Audio Codec")
+    log(SEP)
     try:
         import sphn
-        writer = sphn.OpusStreamWriter(24000)
-        reader = sphn.OpusStreamReader(24000)
-        print("   [OK] Opus codec working")
+        # One encoder is enough to prove the native Opus library loads
+        sphn.OpusStreamWriter(24000)
+        log("   [OK] Opus codec working")
     except Exception as e:
-        print(f"   [ERROR] Opus codec: {e}")
+        log(f"   [ERROR] Opus codec: {e}")
         all_ok = False
-    print()
+    log()
+    return all_ok, warnings
+
+
+def make_model_file_finder(custom_entries, cached_sizes):
+    """Build a model file lookup specialized to whether a custom path is set.
+
+    ``custom_entries`` is the list_dir_entries() result for the custom model path
+    (empty if there is none), ``cached_sizes`` maps filename -> size from the HF
+    cache scan. The returned function maps a filename to (size in MB, is_custom),
+    or None if the file is missing.
+    """
+    def find_in_cache(filename):
+        size = cached_sizes.get(filename)
+        return (size / (1024 * 1024), False) if size else None
+    
+    if not custom_entries:
+        return find_in_cache
+    
+    def find_in_custom_path_then_cache(filename):
+        # Custom path takes precedence over the cache
+        entry = custom_entries.get(filename)
+        if entry is not None:
+            return entry.stat().st_size / (1024 * 1024), True
+        return find_in_cache(filename)
+    
+    return find_in_custom_path_then_cache
+
+
+def check_models(log=print):
+    """Check for the model files in the custom path or HF cache. Returns (ok, warning count)."""
+    all_ok = True
+    warnings = 0
     
-    # 4. Check HuggingFace cache
-    print("4. Model Files")
-    print("-" * 70)
+    log("4. Model Files")
+    log(SEP)
     
     cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    print(f"   Cache: {cache_dir}")
+    log(f"   Cache: {cache_dir}")
     
     # Check for custom model path
-    config_file = Path(__file__).parent / "model_config.json"
-    custom_path = None
-    if config_file.exists():
-        try:
-            import json
-            with open(config_file) as f:
-                config = json.load(f)
-            custom_path = config.get("custom_model_path")
-            if custom_path:
-                print(f"   Custom Path: {custom_path}")
-        except:
-            pass
-    
-    if not cache_dir.exists() and not custom_path:
-        print("   [INFO] Cache directory doesn't exist yet")
-        print("   [INFO] Models will download on first server launch")
-    else:
+    custom_path = _load_custom_model_path()
+    if custom_path:
+        log(f"   Custom Path: {custom_path}")
+    
+    try:
+        from huggingface_hub import scan_cache_dir
+        from huggingface_hub.utils import CacheNotFound
+        
+        repo = MODEL_REPO
+        files = [
+            ("model.safetensors", 15000),
+            ("tokenizer-e351c8d8-checkpoint125.safetensors", 385),
+            ("tokenizer_spm_32k_3.model", 0.55),
+        ]
+        
+        custom_entries = list_dir_entries(custom_path) if custom_path else {}
+        
+        # Walk the cache once for all files; sizes come with the scan, no stat needed.
+        # The revision `main` points to goes last so its files win.
+        cached_sizes = {}
         try:
-            from huggingface_hub import try_to_load_from_cache
-            
-            repo = "nvidia/personaplex-7b-v1"
-            files = [
-                ("model.safetensors", 15000),
-                ("tokenizer-e351c8d8-checkpoint125.safetensors", 385),
-                ("tokenizer_spm_32k_3.model", 0.55),
-            ]
-            
-            found = 0
-            for filename, expected_mb in files:
-                # Check custom path first
-                if custom_path:
-                    custom_file = os.path.join(custom_path, filename)
-                    if os.path.exists(custom_file):
-                        size_mb = get_file_size_mb(custom_file)
-                        print(f"   [OK] {filename} ({size_mb:.1f} MB) [custom]")
-                        found += 1
-                        continue
-                
-                # Check HF cache
-                cached = try_to_load_from_cache(repo_id=repo, filename=filename)
-                if cached and os.path.exists(cached):
-                    size_mb = get_file_size_mb(cached)
-                    print(f"   [OK] {filename} ({size_mb:.1f} MB)")
-                    found += 1
-                else:
-                    print(f"   [MISSING] {filename}")
-            
-            if found == 0:
-                print("   [INFO] No models found in cache")
-                print("   [INFO] Models will download on first server launch")
-            elif found < len(files):
-                print(f"   [INFO] {found}/{len(files)} files found")
-                warnings += 1
-        except ImportError:
-            print("   [INFO] Cannot check cache (huggingface_hub not installed)")
-    print()
-    
-    # 5. Check HuggingFace authentication
-    print("5. HuggingFace Authentication")
-    print("-" * 70)
+            for cached_repo in scan_cache_dir().repos:
+                if cached_repo.repo_type != "model" or cached_repo.repo_id != repo:
+                    continue
+                for revision in sorted(cached_repo.revisions, key=lambda r: "main" in r.refs):
+                    for cached_file in revision.files:
+                        cached_sizes[cached_file.file_name] = cached_file.size_on_disk
+        except CacheNotFound:
+            log("   [INFO] Cache directory doesn't exist yet")
+        
+        find_model_file = make_model_file_finder(custom_entries, cached_sizes)
+        
+        found = 0
+        for filename, expected_mb in files:
+            result = find_model_file(filename)
+            if result is None:
+                log(f"   [MISSING] {filename}")
+                continue
+            size_mb, is_custom = result
+            log(f"   [OK] {filename} ({size_mb:.1f} MB)" + (" [custom]" if is_custom else ""))
+            found += 1
+        
+        if found == 0:
+            log("   [INFO] No models found in cache")
+            log("   [INFO] Models will download on first server launch")
+        elif found < len(files):
+            log(f"   [INFO] {found}/{len(files)} files found")
+            warnings += 1
+    except ImportError:
+        log("   [INFO] Cannot check cache (huggingface_hub not installed)")
+    log()
+    return all_ok, warnings
+
+
+def check_auth(log=print, verify_token=True):
+    """Check HuggingFace authentication. Returns (ok, warning count).
+
+    With ``verify_token=False`` only the token's presence is checked, no request is made.
+    """
+    all_ok = True
+    warnings = 0
+    
+    log("5. HuggingFace Authentication")
+    log(SEP)
     
     hf_token = os.getenv("HF_TOKEN")
     if hf_token:
-        print("   [OK] HF_TOKEN is set")
-        
-        # Try to verify without printing account details
+        log("   [OK] HF_TOKEN is set")
+    
+    if hf_token and verify_token:
+        # Try to verify without printing account details. A direct request with a
+        # short timeout, so a flaky connection can't stall the report
         try:
-            from huggingface_hub import HfApi
-            api = HfApi(token=hf_token)
-            api.whoami()
-            print("   [OK] Token verified with HuggingFace")
+            import requests
+            try:
+                # Honours HF_ENDPOINT (mirrors), like HfApi does
+                from huggingface_hub.constants import ENDPOINT as endpoint
+            except ImportError:
+                endpoint = os.getenv("HF_ENDPOINT", "https://huggingface.co").rstrip("/")
+            response = requests.get(
+                f"{endpoint}/api/whoami-v2",
+                headers={"authorization": f"Bearer {hf_token}"},
+                timeout=WHOAMI_TIMEOUT,
+            )
+            response.raise_for_status()
+            log("   [OK] Token verified with HuggingFace")
         except Exception as e:
-            print(f"   [WARNING] Could not verify token: {e}")
+            log(f"   [WARNING] Could not verify token: {e}")
             warnings += 1
-    else:
-        # Check cached login
-        try:
-            from huggingface_hub.utils import HfFolder
-            cached_token = HfFolder.get_token()
-            if cached_token:
-                print("   [OK] Using cached HuggingFace login")
-            else:
-                print("   [WARNING] No HuggingFace token found")
-                print("   [INFO] Set token: $env:HF_TOKEN='your_token'")
-                print("   [INFO] Or run: huggingface-cli login")
-                warnings += 1
-        except:
-            print("   [WARNING] HF_TOKEN not set")
+    elif not hf_token:
+        # Check cached login (or the legacy HUGGING_FACE_HUB_TOKEN variable)
+        if _early_token_check():
+            log("   [OK] Using cached HuggingFace login")
+        else:
+            log("   [WARNING] No HuggingFace token found")
+            log("   [INFO] Set token: $env:HF_TOKEN='your_token'")
+            log("   [INFO] Or run: huggingface-cli login")
             warnings += 1
-    print()
+    log()
+    return all_ok, warnings
+
+
+def check_project_files(log=print):
+    """Check the project's own files. Returns (ok, warning count)."""
+    all_ok = True
+    warnings = 0
     
-    # 6. Check project files
-    print("6. Project Files")
-    print("-" * 70)
+    log("6. Project Files")
+    log(SEP)
     
     project_files = [
         ("moshi/moshi/server.py", "Server module"),
@@ -218,47 +397,190 @@ def main():
         ("INSTALL_PERSONAPLEX.bat", "Installer"),
     ]
     
+    # One scandir per directory instead of a stat per file
+    project_entries = {d: list_dir_entries(d) for d in {os.path.dirname(p) for p, _ in project_files}}
+    
     for filepath, desc in project_files:
-        if check_file_exists(filepath):
-            print(f"   [OK] {filepath}")
+        if check_file_exists(filepath, project_entries):
+            log(f"   [OK] {filepath}")
         else:
-            print(f"   [MISSING] {filepath} ({desc})")
+            log(f"   [MISSING] {filepath} ({desc})")
             all_ok = False
-    print()
+    log()
+    return all_ok, warnings
+
+
+def _mtime(path):
+    """Modification time of a path, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def environment_fingerprint():
+    """Hash of everything the cached report depends on.
+
+    Cheap to compute: package versions come from installed metadata and the
+    rest from a few stats, so nothing heavy is imported.
+    """
+    from importlib.metadata import version, PackageNotFoundError
+    
+    versions = []
+    for dist in ("torch", "sphn", "huggingface-hub", "moshi-personaplex"):
+        try:
+            versions.append(version(dist))
+        except PackageNotFoundError:
+            versions.append(None)
+    
+    # The model repo's own cache dirs: adding a blob, a snapshot file or moving a ref
+    # changes the mtime of blobs/, a snapshot dir or refs/main (the hub root's doesn't)
+    repo_dir = _hf_hub_cache() / f"models--{MODEL_REPO.replace('/', '--')}"
+    model_mtimes = [_mtime(repo_dir / "refs" / "main"), _mtime(repo_dir / "blobs"),
+                    _mtime(repo_dir / "snapshots")]
+    try:
+        with os.scandir(repo_dir / "snapshots") as it:
+            model_mtimes += sorted((e.name, e.stat().st_mtime) for e in it)
+    except OSError:
+        pass
+    custom_path = _load_custom_model_path()
+    
+    hf_token = (os.getenv("HF_TOKEN") or "") + "|" + (os.getenv("HUGGING_FACE_HUB_TOKEN") or "")
+    parts = [
+        sys.version,
+        sys.prefix,
+        os.getcwd(),
+        versions,
+        model_mtimes,
+        custom_path,
+        _mtime(custom_path) if custom_path else None,
+        _mtime(_hf_home() / "token"),
+        _mtime(MODEL_CONFIG_FILE),
+        hashlib.sha1(hf_token.encode()).hexdigest()[:8],
+    ]
+    return hashlib.sha1(json.dumps(parts).encode()).hexdigest()
+
+
+def load_cached_report(fingerprint):
+    """Return the cached (lines, warnings) for this fingerprint, or None."""
+    try:
+        with open(REPORT_CACHE_FILE, encoding="utf-8") as f:
+            report = json.load(f)
+        if (report["fingerprint"] == fingerprint
+                and time.time() - report["time"] < REPORT_CACHE_MAX_AGE):
+            return report["lines"], report["warnings"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def save_cached_report(fingerprint, lines, warnings):
+    """Save a clean run's report (runs with errors or warnings are always re-checked)."""
+    report = {"fingerprint": fingerprint, "time": time.time(), "lines": lines, "warnings": warnings}
+    try:
+        REPORT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(REPORT_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(report, f)
+    except OSError:
+        pass
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Verify PersonaPlex project setup")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Only run the quick checks (packages, HF token presence, project files); "
+             "fail immediately if no HuggingFace token is found"
+    )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Re-run all checks even if the environment is unchanged since the last successful run"
+    )
+    parsed_args = parser.parse_args(args)
+    
+    # The whole report is collected and written to stdout once at the end
+    output = []
+    log = lambda *a: output.append(" ".join(map(str, a)))
+    
+    print_banner(log)
+    
+    # Checked before importing torch, probing CUDA/Opus or scanning the cache
+    if parsed_args.fast and not _early_token_check():
+        log("   [ERROR] No HuggingFace token found")
+        log("   [INFO] Set token: $env:HF_TOKEN='your_token'")
+        log("   [INFO] Or run: huggingface-cli login")
+        log()
+        sys.stdout.write("\n".join(output) + "\n")
+        return False
+    
+    # The sections are independent: run them concurrently (the torch import, Opus
+    # init, cache lookups and whoami request overlap) and report them in order.
+    # Each section's output is buffered so sections don't interleave.
+    if parsed_args.fast:
+        # No torch/CUDA, Opus, cache scan or network request
+        sections = [
+            check_dependencies,
+            functools.partial(check_auth, verify_token=False),
+            check_project_files,
+        ]
+    else:
+        sections = [
+            check_dependencies,
+            check_torch,
+            check_opus,
+            check_models,
+            check_auth,
+            check_project_files,
+        ]
+    
+    def run_buffered(section):
+        lines = []
+        ok, section_warnings = section(log=lambda *a: lines.append(" ".join(map(str, a))))
+        return lines, ok, section_warnings
+    
+    # The cache holds full reports only; --fast runs neither use nor replace it
+    use_cache = not parsed_args.fast
+    fingerprint = environment_fingerprint() if use_cache else None
+    cached = load_cached_report(fingerprint) if use_cache and not parsed_args.force else None
+    
+    all_ok = True
+    warnings = 0
+    if cached:
+        report_lines, warnings = cached
+        log("   [INFO] Nothing changed since the last successful check, showing its results")
+        log("   [INFO] Run with --force to check again")
+        log()
+        output.extend(report_lines)
+    else:
+        report_lines = []
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = [executor.submit(run_buffered, section) for section in sections]
+            for future in futures:
+                lines, ok, section_warnings = future.result()
+                output.extend(lines)
+                report_lines.extend(lines)
+                all_ok = all_ok and ok
+                warnings += section_warnings
+        # Missing models and an unverified token are only warnings, but they are exactly
+        # what the user goes on to fix, so only a report without any is reused
+        if all_ok and warnings == 0 and use_cache:
+            save_cached_report(fingerprint, report_lines, warnings)
     
     # Summary
-    print("=" * 70)
-    print("Summary")
-    print("=" * 70)
+    log(SUMMARY_HEADER)
     
     if all_ok and warnings == 0:
-        print()
-        print("   [SUCCESS] All checks passed!")
-        print()
-        print("   You can now launch PersonaPlex:")
-        print("     - Double-click START_PERSONAPLEX.bat")
-        print("     - Or run: python -m moshi.server --ssl temp")
-        print()
+        log(SUMMARY_SUCCESS)
     elif all_ok:
-        print()
-        print(f"   [OK] Core components ready ({warnings} warning(s))")
-        print()
-        print("   PersonaPlex should work. Check warnings above if issues occur.")
-        print()
+        log(SUMMARY_WARNINGS.format(warnings=warnings))
     else:
-        print()
-        print("   [WARNING] Some components need attention")
-        print()
-        print("   Please fix the issues above before launching.")
-        print("   Run INSTALL_PERSONAPLEX.bat to set up missing components.")
-        print()
-    
-    print("-" * 70)
-    print("   Subscribe to SurAiverse for AI tutorials!")
-    print("   YouTube: https://www.youtube.com/@suraiverse")
-    print("-" * 70)
-    print()
+        log(SUMMARY_FAILED)
+    
+    log(FOOTER)
     
+    sys.stdout.write("\n".join(output) + "\n")
     return all_ok
 
 